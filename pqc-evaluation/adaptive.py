@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+# Internal imports
+import stats
+
+def converged(df, target_precision, rng=None):
+    """
+    Checks whether the median CI of every operation is within the target precision.
+
+    Parameters:
+        df (pd.DataFrame): Time evaluation of a single variant.
+        target_precision (float): Maximum relative half-width of the median CI.
+        rng (np.random.Generator): Random generator used for resampling.
+
+    Returns:
+        bool: True if every operation has converged.
+    """
+    operations = [col for col in df.columns if col not in ("variant", "warm_up") and df[col].notna().any()]
+
+    return all(
+        stats.relative_ci_half_width(df[col].to_numpy(dtype=float), rng=rng) <= target_precision
+        for col in operations
+    )
+
+def adaptive_time_evaluation(variant, runs, warm_up, time_evaluation, target_precision, max_runs):
+    """
+    Samples a variant in chunks until the relative half-width of the median
+    confidence interval of each operation drops below `target_precision`.
+
+    The first chunk has `runs` samples and each new chunk doubles the number
+    of samples collected so far, up to `max_runs` samples in total.
+
+    Parameters:
+        variant (str): Variant to evaluate.
+        runs (int): Minimum number of samples.
+        warm_up (int or str): Number of warm up executions, or "auto", done only
+            before the first chunk.
+        time_evaluation (callable): Time evaluation of the variant (e.g., `kem.time_evaluation`).
+        target_precision (float): Maximum relative half-width of the median CI.
+        max_runs (int): Maximum number of samples.
+
+    Returns:
+        pd.DataFrame: Time evaluation with all the samples collected.
+    """
+    rng = np.random.default_rng(0)
+
+    df = time_evaluation(variant=variant, runs=runs, warm_up=warm_up)
+
+    while len(df) < max_runs and not converged(df, target_precision, rng):
+        chunk = min(len(df), max_runs - len(df))
+        df = pd.concat([df, time_evaluation(variant=variant, runs=chunk, warm_up=0)], ignore_index=True)
+
+    # Only the first chunk is warmed up
+    df['warm_up'] = df['warm_up'].iloc[0]
+
+    print(f"{variant}: {len(df)} runs")
+
+    return df
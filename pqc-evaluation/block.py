@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import pandas as pd
+
+# Internal imports
+import timing
+
+MODES = ("serial", "thread", "process")
+
+def split_block(transactions, parts):
+    """
+    Splits the transactions of a block into `parts` chunks of similar size.
+    """
+    return [transactions[i::parts] for i in range(parts) if transactions[i::parts]]
+
+def verify_parallel(executor, verify_block, variant, chunks):
+    return all(executor.map(verify_block, [variant] * len(chunks), chunks))
+
+def block_evaluation(variant, nist_level, generate_block, verify_block, size, runs, warm_up, workers):
+    """
+    Measures the end-to-end verification time of a block of `size` signed
+    transactions, serially, with a thread pool and with a process pool.
+
+    Args:
+        variant (str): Signature variant.
+        nist_level (int): Claimed NIST level of the variant.
+        generate_block (callable): Builds the block, as `sig.generate_block`.
+        verify_block (callable): Verifies a list of transactions, as `sig.verify_block`.
+        size (int): Number of transactions in the block.
+        runs (int): Number of timed verifications of the block per mode.
+        warm_up (int or str): Number of untimed verifications of the block per
+            mode, or "auto" to detect steady state.
+        workers (int): Number of threads and processes of the pools.
+
+    Returns:
+        pd.DataFrame: One row per timed verification, with the time in nanoseconds.
+    """
+
+    block = generate_block(variant, size)
+    chunks = split_block(block, workers)
+
+    frames = []
+
+    with ThreadPoolExecutor(max_workers=workers) as threads, ProcessPoolExecutor(max_workers=workers) as processes:
+
+        verifications = {
+            "serial": lambda: verify_block(variant, block),
+            "thread": lambda: verify_parallel(threads, verify_block, variant, chunks),
+            "process": lambda: verify_parallel(processes, verify_block, variant, chunks),
+        }
+
+        for mode in MODES:
+            verification = verifications[mode]
+
+            # At least one untimed verification, so the pool workers are already running
+            timing.run_warm_up(verification, warm_up=warm_up if warm_up == "auto" else max(warm_up, 1))
+
+            time_verification, = timing.samples(runs, 1)
+
+            for i in range(runs):
+                is_valid, elapsed = timing.measure(verification)
+                time_verification[i] = elapsed
+
+                if not is_valid:
+                    print(f"WARNING: Block verification failed for {variant} ({mode}) at iteration {i}!")
+
+            frames.append(pd.DataFrame({
+                'variant': variant,
+                'nist_level': nist_level,
+                'mode': mode,
+                'workers': 1 if mode == "serial" else workers,
+                'block_size': size,
+                'time': time_verification,
+            }))
+
+    return pd.concat(frames, ignore_index=True)
+
+def summarize_blocks(df):
+    """
+    Summarizes the block verification times per variant and mode.
+
+    Returns:
+        pd.DataFrame: Mean and std of the block verification time in
+        milliseconds, and the verified transactions per second.
+    """
+    grouped = df.groupby(['variant', 'nist_level', 'mode', 'workers', 'block_size'], sort=False)['time']
+
+    result = pd.DataFrame({
+        'mean_time': grouped.mean() / timing.NS_PER_MS,
+        'std_time': grouped.std() / timing.NS_PER_MS,
+    }).reset_index()
+
+    result['tx_per_second'] = result['block_size'] / (result['mean_time'] / 1000)
+    return result
@@ -0,0 +1,57 @@
+import hashlib
+import json
+import os
+import oqs
+
+# Internal imports
+import utils
+
+def catalog_key(mechanisms):
+    """
+    Identifies a catalog by the liboqs version and the enabled mechanisms.
+    """
+    content = json.dumps({
+        "liboqs": oqs.oqs_version(),
+        "liboqs_python": oqs.oqs_python_version(),
+        "mechanisms": list(mechanisms),
+    })
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def load_catalog(name, oqs_mechanisms, size_evaluation):
+    """
+    Loads the catalog of enabled mechanisms, with the NIST level and sizes of
+    every variant, from a JSON cache file.
+
+    The cache is rebuilt with `size_evaluation` whenever the liboqs version or
+    the list of enabled mechanisms changes.
+
+    Args:
+        name (str): Name of the catalog (e.g., "kem" or "sig").
+        oqs_mechanisms (callable): Returns the enabled mechanisms
+            (e.g., `oqs.get_enabled_kem_mechanisms`).
+        size_evaluation (callable): Returns the NIST level and sizes of a
+            variant (e.g., `kem.size_evaluation`).
+
+    Returns:
+        dict: Maps each enabled variant to its `size_evaluation` record,
+        preserving the order of `oqs_mechanisms`.
+    """
+    mechanisms = oqs_mechanisms()
+    key = catalog_key(mechanisms)
+    file = os.path.join(utils.DIR_CACHE, f"{name}-catalog.json")
+
+    if os.path.exists(file):
+        with open(file) as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["variants"]
+
+    variants = {variant: size_evaluation(variant) for variant in mechanisms}
+
+    os.makedirs(utils.DIR_CACHE, exist_ok=True)
+    tmp = f"{file}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"key": key, "variants": variants}, f, indent=2)
+    os.replace(tmp, file)
+
+    return variants
@@ -0,0 +1,69 @@
+import json
+import os
+
+# Internal imports
+import store
+
+DIR_CHECKPOINTS = "checkpoints"
+PARAMS_FILE = "params.json"
+
+def checkpoint_path(dir_results, variant):
+    return os.path.join(dir_results, DIR_CHECKPOINTS, f"{variant}.{store.EXTENSION}")
+
+def has_checkpoint(dir_results, variant):
+    return os.path.exists(checkpoint_path(dir_results, variant))
+
+def save_checkpoint(df, dir_results, variant):
+    """
+    Writes the results of a variant to its checkpoint file.
+
+    The file is written under a temporary name and then renamed, so an
+    interrupted write never leaves a partial checkpoint behind.
+    """
+    file = checkpoint_path(dir_results, variant)
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    store.save_frame(df, file)
+    print(f"Checkpoint {file} was created")
+
+def load_checkpoint(dir_results, variant):
+    return store.load_frame(checkpoint_path(dir_results, variant))
+
+def params_path(dir_results):
+    return os.path.join(dir_results, DIR_CHECKPOINTS, PARAMS_FILE)
+
+def save_params(dir_results, params):
+    """
+    Records the parameters the checkpoints of a results directory are made with.
+    """
+    file = params_path(dir_results)
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    with open(file, "w") as f:
+        json.dump(params, f, indent=2)
+
+def mismatched_params(dir_results, params):
+    """
+    Compares the parameters of an evaluation with those of the checkpoints
+    already in a results directory.
+
+    Args:
+        dir_results (str): Results directory being resumed.
+        params (dict): Parameters of the evaluation (e.g., runs and timing mode).
+
+    Returns:
+        list of str: One message per parameter that differs, empty if the
+        checkpoints can be reused or there are none.
+    """
+    file = params_path(dir_results)
+    if not os.path.exists(file):
+        return []
+
+    with open(file) as f:
+        saved = json.load(f)
+
+    return [
+        f"{name} {saved.get(name)} (requested {value})"
+        for name, value in params.items()
+        if saved.get(name) != value
+    ]
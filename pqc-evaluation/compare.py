@@ -0,0 +1,184 @@
+import argparse
+import glob
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+# Internal imports
+import utils
+import stats
+import store
+import timing
+
+# Columns of the raw time evaluation that are not operations
+NON_OPERATION_COLUMNS = ["variant", "warm_up"]
+
+def operations(df):
+    return [col for col in df.columns if col not in NON_OPERATION_COLUMNS]
+
+def is_nanoseconds(df):
+    """
+    Whether the operations of a CSV time evaluation are in nanoseconds.
+
+    Runs timed with `perf_counter_ns` store integer nanoseconds, while the
+    runs before them stored the float milliseconds of `time.time`, which are
+    practically never all integral.
+    """
+    values = df[operations(df)].to_numpy(dtype=float)
+    values = values[~np.isnan(values)]
+    return bool(np.all(values == np.round(values)))
+
+def load_times(dir_results):
+    """
+    Loads the raw time evaluation (`time-evaluation-<runs>x.npz`, or the
+    `.csv` of runs without the columnar store) of a results directory.
+
+    The float milliseconds of the CSV files of runs before the nanosecond
+    timings are converted to nanoseconds.
+
+    Args:
+        dir_results (str): Results directory created by `utils.create_result_dirs`.
+
+    Returns:
+        pd.DataFrame: One row per run, with one nanosecond column per operation.
+
+    Raises:
+        argparse.ArgumentTypeError: If the directory does not hold exactly one raw time evaluation.
+    """
+    files = glob.glob(os.path.join(dir_results, f"time-evaluation-*x.{store.EXTENSION}"))
+    if len(files) == 1:
+        return store.load_frame(files[0])
+
+    if not files:
+        files = glob.glob(os.path.join(dir_results, "time-evaluation-*x.csv"))
+
+    if len(files) != 1:
+        raise argparse.ArgumentTypeError(f"Expected one time-evaluation-<runs>x file in {dir_results}, found {len(files)}")
+
+    df = pd.read_csv(files[0])
+
+    if not is_nanoseconds(df):
+        print(f"{files[0]} holds milliseconds, converted to nanoseconds")
+        df[operations(df)] = df[operations(df)] * timing.NS_PER_MS
+
+    return df
+
+def compare_times(df_baseline, df_candidate, threshold=0.05, alpha=0.01, n_bootstrap=1000, confidence=0.95, seed=0):
+    """
+    Compares the timings of every variant and operation present in both runs.
+
+    The speedup is the ratio of the baseline median to the candidate median,
+    so values below 1 mean the candidate is slower. A comparison is a
+    regression when the Mann-Whitney U test is significant at `alpha` and the
+    candidate median is more than `threshold` slower than the baseline.
+
+    Args:
+        df_baseline (pd.DataFrame): Raw time evaluation of the baseline run.
+        df_candidate (pd.DataFrame): Raw time evaluation of the candidate run.
+        threshold (float): Relative slowdown above which a significant change is a regression.
+        alpha (float): Significance level of the Mann-Whitney U test.
+        n_bootstrap (int): Number of bootstrap resamples of the speedup CI.
+        confidence (float): Confidence level of the speedup CI.
+        seed (int): Seed of the bootstrap resampling.
+
+    Returns:
+        pd.DataFrame: One row per variant and operation, ranked from the
+        largest slowdown to the largest speedup.
+    """
+    rng = np.random.default_rng(seed)
+
+    common_operations = [op for op in operations(df_baseline) if op in df_candidate.columns]
+
+    baseline_groups = dict(tuple(df_baseline.groupby("variant", sort=False)))
+    candidate_groups = dict(tuple(df_candidate.groupby("variant", sort=False)))
+
+    rows = []
+    for variant, baseline in baseline_groups.items():
+        if variant not in candidate_groups:
+            continue
+        candidate = candidate_groups[variant]
+
+        for op in common_operations:
+            x = baseline[op].dropna().to_numpy(dtype=float)
+            y = candidate[op].dropna().to_numpy(dtype=float)
+
+            if len(x) == 0 or len(y) == 0:
+                continue
+
+            median_baseline, median_candidate = np.median(x), np.median(y)
+            change = median_candidate / median_baseline - 1
+            ci_low, ci_high = stats.bootstrap_speedup_ci(x, y, n_bootstrap, confidence, rng)
+            u, p_value = stats.mann_whitney_u(x, y)
+
+            rows.append({
+                "variant": variant,
+                "operation": op,
+                "median_baseline": median_baseline / timing.NS_PER_MS,
+                "median_candidate": median_candidate / timing.NS_PER_MS,
+                "speedup": median_baseline / median_candidate,
+                "ci_low": ci_low,
+                "ci_high": ci_high,
+                "change": change,
+                "u": u,
+                "p_value": p_value,
+                "significant": p_value < alpha,
+                "regression": p_value < alpha and change > threshold,
+            })
+
+    df = pd.DataFrame(rows)
+
+    if df.empty:
+        return df
+
+    return df.sort_values("change", ascending=False, ignore_index=True)
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(
+        prog="main.py compare",
+        description="Compares the time evaluation of two runs and detects regressions",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("baseline", help="Results directory of the baseline run", type=str)
+    parser.add_argument("candidate", help="Results directory of the candidate run", type=str)
+    parser.add_argument("--threshold", help="Relative slowdown of the median above which a significant change is a regression (e.g., 0.05 for 5%%)", type=utils.positive_float, default=0.05)
+    parser.add_argument("--alpha", help="Significance level of the Mann-Whitney U test", type=utils.positive_float, default=0.01)
+    parser.add_argument("--show-graph", help="Display the delta plot", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    try:
+        df_baseline = load_times(args.baseline)
+        df_candidate = load_times(args.candidate)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    df_comparison = compare_times(df_baseline, df_candidate, threshold=args.threshold, alpha=args.alpha)
+
+    if df_comparison.empty:
+        parser.error("The runs have no variant and operation in common")
+
+    import plots
+
+    dir_results, dir_graph = utils.create_result_dirs("compare")
+
+    file = f"{dir_results}/comparison.csv"
+    df_comparison.to_csv(file, index=False)
+    print(f"File {file} was created")
+
+    plots.plot_comparison(df_comparison, dir_graph, show_graph=args.show_graph)
+
+    print(df_comparison.to_string(
+        index=False,
+        columns=["variant", "operation", "median_baseline", "median_candidate", "speedup", "ci_low", "ci_high", "p_value", "regression"],
+        float_format=lambda value: f"{value:.4g}",
+    ))
+
+    regressions = df_comparison[df_comparison["regression"]]
+    if not regressions.empty:
+        print(f"{len(regressions)} significant regression(s) above {args.threshold:.1%}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import mmap
+import os
+import random
+
+# Internal imports
+import utils
+
+MESSAGE_SIZE = 60
+DEFAULT_SIZE = 16 * 1024 ** 2
+DEFAULT_SEED = 0
+
+# Corpora already mapped by this process, keyed by path
+_mapped = {}
+
+def corpus_path(seed=DEFAULT_SEED, size=DEFAULT_SIZE):
+    return os.path.join(utils.DIR_CACHE, f"corpus-seed{seed}-{size}.bin")
+
+def generate_corpus(path, seed=DEFAULT_SEED, size=DEFAULT_SIZE):
+    """
+    Writes `size` seeded pseudo-random bytes to `path`, unless the file already
+    exists with that size. The same seed produces the same corpus on any machine.
+
+    Returns:
+        str: Path of the corpus.
+    """
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return path
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(random.Random(seed).randbytes(size))
+    os.replace(tmp, path)
+    print(f"Corpus {path} was created")
+
+    return path
+
+def load_corpus(path=None):
+    """
+    Maps a corpus file into memory, read-only.
+
+    Parameters:
+        path (str, optional): Path of the corpus. Defaults to the corpus of
+            the default seed and size, generated if missing.
+
+    Returns:
+        memoryview: View over the mapped corpus; slices of it are not copied.
+    """
+    path = path or generate_corpus(corpus_path())
+
+    if path not in _mapped:
+        with open(path, "rb") as f:
+            _mapped[path] = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    return _mapped[path]
+
+def message(corpus, i, size=MESSAGE_SIZE):
+    """
+    Returns the `i`-th message of `size` bytes of the corpus, without copying.
+    Messages wrap around when the corpus is exhausted.
+    """
+    offset = (i * size) % (len(corpus) - size + 1)
+    return corpus[offset:offset + size]
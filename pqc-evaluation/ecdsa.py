@@ -1,86 +1,361 @@
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat, PublicFormat, NoEncryption, load_der_private_key
 from cryptography.exceptions import InvalidSignature
-from time import time
-import random
-import string
+from functools import partial
+import tempfile
 import pandas as pd
 
-def time_evaluation(variant, runs, warm_up):
+# Internal imports
+import corpus
+import memory
+import resumption
+import timing
+from rules import CLASSICAL_MECHANISMS
 
-    curves = {
-        "P-256": ec.SECP256R1(),
-        "P-384": ec.SECP384R1(),
-        "P-521": ec.SECP521R1(),
-    }
+ED25519 = "Ed25519"
 
-    if variant not in curves:
-        raise ValueError(f"Unknown variant {variant}. Available: {list(curves.keys())}")
+CURVES = {
+    "P-256": ec.SECP256R1(),
+    "P-384": ec.SECP384R1(),
+    "P-521": ec.SECP521R1(),
+    "secp256k1": ec.SECP256K1(),
+    "Ed25519": ED25519,
+}
 
-    curve = curves[variant]
+# Built once and shared by every ECDSA signature and verification
+ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
 
-    # Warm up
-    for i in range(warm_up):
+def get_curve(variant):
+    if variant not in CURVES:
+        raise ValueError(f"Unknown variant {variant}. Available: {list(CURVES.keys())}")
+    return CURVES[variant]
 
-        message = ''.join(random.choices(string.ascii_letters + string.digits, k=60)).encode("utf-8")
+def signature_algorithm(curve):
+    """
+    Extra arguments of `sign` and `verify`: Ed25519 takes none, ECDSA takes
+    the signature algorithm.
+    """
+    return () if curve == ED25519 else (ECDSA_SHA256,)
 
-        sk = ec.generate_private_key(curve)
-        pk = sk.public_key()
+def generate_keypair(curve):
+    sk = ed25519.Ed25519PrivateKey.generate() if curve == ED25519 else ec.generate_private_key(curve)
+    return sk, sk.public_key()
 
-        signature = sk.sign(
-            message,
-            ec.ECDSA(hashes.SHA256())
-        )
+def verify(pk, signature, message, *algorithm):
+    try:
+        pk.verify(signature, message, *algorithm)
+    except InvalidSignature:
+        return False
+    return True
 
-        try:
-            pk.verify(
-                signature,
-                message,
-                ec.ECDSA(hashes.SHA256())
-            )
-        except InvalidSignature:
-            print(f"WARNING: Verification failed at iteration {i}!")
-        
+def encode_public_key(curve, pk):
+    if curve == ED25519:
+        return pk.public_bytes_raw()
+    return pk.public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
+
+def decode_public_key(curve, public_key):
+    if curve == ED25519:
+        return ed25519.Ed25519PublicKey.from_public_bytes(public_key)
+    return ec.EllipticCurvePublicKey.from_encoded_point(curve, public_key)
+
+def warm_up_cycle(curve, message):
+
+    algorithm = signature_algorithm(curve)
+
+    sk, pk = generate_keypair(curve)
+
+    signature = sk.sign(message, *algorithm)
+
+    if not verify(pk, signature, message, *algorithm):
+        print("WARNING: Verification failed during warm up!")
+
+
+def time_evaluation(variant, runs, warm_up, corpus_path=None):
+
+    curve = get_curve(variant)
+    algorithm = signature_algorithm(curve)
 
-    time_keypair, time_sign, time_verify = [], [], []
+    messages = corpus.load_corpus(corpus_path)
+
+    # Warm up
+    warm_up_runs = timing.run_warm_up(warm_up_cycle, curve, corpus.message(messages, 0), warm_up=warm_up)
+
+    time_keypair, time_sign, time_verify = timing.samples(runs, 3)
     
     # Runs
     for i in range(runs):
 
-        message = ''.join(random.choices(string.ascii_letters + string.digits, k=60)).encode("utf-8")
+        message = corpus.message(messages, i)
 
-        start_keypair = time()
-        sk = ec.generate_private_key(curve)
-        pk = sk.public_key()
-        end_keypair = time()
+        (sk, pk), elapsed = timing.measure(generate_keypair, curve)
 
-        time_keypair.append((end_keypair - start_keypair) * 1000)
+        time_keypair[i] = elapsed
 
-        start_sign=time()
-        signature = sk.sign(
-            message,
-            ec.ECDSA(hashes.SHA256())
-        )
-        end_sign=time()
-    
-        time_sign.append((end_sign - start_sign) * 1000)
-
-        try:
-            start_verify=time()
-            pk.verify(
-                signature,
-                message,
-                ec.ECDSA(hashes.SHA256())
-            )
-            end_verify=time()
-        except InvalidSignature:
+        signature, elapsed = timing.measure(sk.sign, message, *algorithm)
+
+        time_sign[i] = elapsed
+
+        is_valid, elapsed = timing.measure(verify, pk, signature, message, *algorithm)
+
+        time_verify[i] = elapsed
+
+        if not is_valid:
             print(f"WARNING: Verification failed at iteration {i}!")
-        
-        time_verify.append((end_verify - start_sign) * 1000)
 
     return pd.DataFrame({
         'variant': [variant] * runs,
         'keypair': time_keypair,
         'sign': time_sign,
-        'verify': time_verify
+        'verify': time_verify,
+        'warm_up': [warm_up_runs] * runs
     })
+
+
+def message_size_evaluation(variant, runs, warm_up, message_sizes, corpus_path=None):
+    """
+    Times signing and verification of messages of each size in `message_sizes`,
+    reusing a single keypair. Messages are sliced from the corpus without copies.
+    """
+
+    curve = get_curve(variant)
+    algorithm = signature_algorithm(curve)
+
+    messages = corpus.load_corpus(corpus_path)
+
+    sk, pk = generate_keypair(curve)
+
+    frames = []
+
+    for size in message_sizes:
+
+        def cycle(message):
+            verify(pk, sk.sign(message, *algorithm), message, *algorithm)
+
+        timing.run_warm_up(cycle, corpus.message(messages, 0, size), warm_up=warm_up)
+
+        time_sign, time_verify = timing.samples(runs, 2)
+
+        for i in range(runs):
+            message = corpus.message(messages, i, size)
+
+            signature, elapsed = timing.measure(sk.sign, message, *algorithm)
+            time_sign[i] = elapsed
+
+            is_valid, elapsed = timing.measure(verify, pk, signature, message, *algorithm)
+            time_verify[i] = elapsed
+
+            if not is_valid:
+                print(f"WARNING: Verification failed at iteration {i} ({size} bytes)!")
+
+        frames.append(pd.DataFrame({'variant': variant, 'message_size': size, 'sign': time_sign, 'verify': time_verify}))
+
+    return pd.concat(frames, ignore_index=True)
+
+def export_secret_key(sk):
+    return sk.private_bytes(Encoding.DER, PrivateFormat.PKCS8, NoEncryption())
+
+def import_secret_key(secret_key):
+    return load_der_private_key(secret_key, password=None)
+
+def resumption_cycle(curve, path, message):
+    sk, pk = generate_keypair(curve)
+    resumption.store_secret_key(path, export_secret_key(sk))
+
+    algorithm = signature_algorithm(curve)
+    signature = import_secret_key(resumption.load_secret_key(path)).sign(message, *algorithm)
+
+    if not verify(pk, signature, message, *algorithm):
+        print("WARNING: Verification failed during warm up!")
+
+def resumption_evaluation(variant, runs, warm_up, dir_keys=None, corpus_path=None):
+    """
+    Times the session resumption of a signer: exporting its secret key as
+    PKCS#8 DER, storing it to disk, loading it back and deserializing it,
+    followed by the first signature of the resumed key.
+    """
+
+    curve = get_curve(variant)
+    algorithm = signature_algorithm(curve)
+
+    messages = corpus.load_corpus(corpus_path)
+
+    time_export, time_store, time_load, time_instantiate, time_sign = timing.samples(runs, 5)
+
+    with tempfile.TemporaryDirectory(dir=dir_keys) as directory:
+
+        path = resumption.key_file(directory, variant)
+
+        # Warm up
+        warm_up_runs = timing.run_warm_up(resumption_cycle, curve, path, corpus.message(messages, 0), warm_up=warm_up)
+
+        # Runs
+        for i in range(runs):
+
+            message = corpus.message(messages, i)
+
+            sk, pk = generate_keypair(curve)
+
+            secret_key, elapsed = timing.measure(export_secret_key, sk)
+            time_export[i] = elapsed
+
+            _, elapsed = timing.measure(resumption.store_secret_key, path, secret_key)
+            time_store[i] = elapsed
+
+            secret_key, elapsed = timing.measure(resumption.load_secret_key, path)
+            time_load[i] = elapsed
+
+            sk, elapsed = timing.measure(import_secret_key, secret_key)
+            time_instantiate[i] = elapsed
+
+            signature, elapsed = timing.measure(sk.sign, message, *algorithm)
+            time_sign[i] = elapsed
+
+            if not verify(pk, signature, message, *algorithm):
+                print(f"WARNING: Verification failed after resumption at iteration {i}!")
+
+    return pd.DataFrame({
+        'variant': [variant] * runs,
+        'export': time_export,
+        'store': time_store,
+        'load': time_load,
+        'instantiate': time_instantiate,
+        'sign': time_sign,
+        'secret_key_bytes': [len(secret_key)] * runs,
+        'warm_up': [warm_up_runs] * runs
+    })
+
+def memory_evaluation(variant, corpus_path=None):
+    """
+    Measures the peak RSS delta and Python allocation peak of keypair,
+    signing and verification (see `memory.measure_memory`).
+    """
+
+    curve = get_curve(variant)
+    algorithm = signature_algorithm(curve)
+
+    message = corpus.message(corpus.load_corpus(corpus_path), 0)
+
+    # Untimed cycle, so the one-time initialization is not measured
+    warm_up_cycle(curve, message)
+
+    (sk, pk), rss_keypair, python_keypair = memory.measure_memory(generate_keypair, curve)
+    signature, rss_sign, python_sign = memory.measure_memory(sk.sign, message, *algorithm)
+    is_valid, rss_verify, python_verify = memory.measure_memory(verify, pk, signature, message, *algorithm)
+
+    if not is_valid:
+        print("WARNING: Verification failed during memory evaluation!")
+
+    return [
+        memory.memory_row(variant, 'keypair', rss_keypair, python_keypair),
+        memory.memory_row(variant, 'sign', rss_sign, python_sign),
+        memory.memory_row(variant, 'verify', rss_verify, python_verify),
+    ]
+
+def generate_block(variant, size, corpus_path=None):
+    """
+    Generates a block of `size` transactions, each signed by a distinct signer.
+
+    Returns:
+        list of tuple: (message, signature, public_key) per transaction, with
+        the public key encoded as a compressed X9.62 point (raw for Ed25519).
+    """
+    curve = get_curve(variant)
+    algorithm = signature_algorithm(curve)
+
+    messages = corpus.load_corpus(corpus_path)
+
+    block = []
+    for i in range(size):
+        # Transactions are pickled to the verifier processes, so they hold bytes
+        message = bytes(corpus.message(messages, i))
+        sk, pk = generate_keypair(curve)
+        signature = sk.sign(message, *algorithm)
+        block.append((message, signature, encode_public_key(curve, pk)))
+
+    return block
+
+def verify_block(variant, transactions):
+    """
+    Verifies the transactions of a block, decoding each signer's public key.
+
+    Returns:
+        bool: True if every signature is valid.
+    """
+    curve = get_curve(variant)
+    algorithm = signature_algorithm(curve)
+
+    return all(
+        verify(decode_public_key(curve, public_key), signature, message, *algorithm)
+        for message, signature, public_key in transactions
+    )
+
+def sign_chunk(variant, secret_key, messages):
+    """
+    Signs a chunk of messages with a single key deserialized from PKCS#8 DER.
+
+    Returns:
+        int: Number of signed messages.
+    """
+    algorithm = signature_algorithm(get_curve(variant))
+
+    sk = import_secret_key(secret_key)
+    for message in messages:
+        sk.sign(message, *algorithm)
+
+    return len(messages)
+
+def scaling_operations(variant, size, corpus_path=None):
+    """
+    Pre-generates the inputs of the scaling benchmark: `size` messages to
+    sign with one key and a block of `size` transactions to verify.
+
+    Returns:
+        dict: Maps each operation to a picklable function of a chunk of
+        inputs and the list of inputs.
+    """
+    transactions = generate_block(variant, size, corpus_path)
+
+    sk, pk = generate_keypair(get_curve(variant))
+
+    return {
+        'sign': (partial(sign_chunk, variant, export_secret_key(sk)), [message for message, _, _ in transactions]),
+        'verify': (partial(verify_block, variant), transactions),
+    }
+
+def size_evaluation(variant):
+    """
+    Sizes of a classical variant, matching the fields of `sig.size_evaluation`.
+
+    Public keys are counted as compressed points and ECDSA signatures at their
+    maximum DER encoded length.
+    """
+    curve = get_curve(variant)
+
+    nist_level = next(
+        level
+        for curves in CLASSICAL_MECHANISMS.values()
+        for level, curve_variant in curves.items()
+        if curve_variant == variant
+    )
+
+    if curve == ED25519:
+        public_key, secret_key, signature = 32, 32, 64
+    else:
+        scalar = (curve.key_size + 7) // 8
+        public_key, secret_key = scalar + 1, scalar
+
+        # SEQUENCE of two INTEGERs. A leading zero byte is only needed when
+        # the top bit of the scalar can be set, i.e. the order fills whole
+        # bytes (not for P-521, whose top byte is at most 0x01)
+        pad = 1 if curve.key_size % 8 == 0 else 0
+        content = 2 * (2 + scalar + pad)
+        signature = content + (2 if content < 128 else 3)
+
+    return {
+        'variant': variant,
+        'nist_level': nist_level,
+        'public_key': public_key,
+        'secret_key': secret_key,
+        'signature': signature
+    }
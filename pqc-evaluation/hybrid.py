@@ -0,0 +1,190 @@
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, x25519
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+import pandas as pd
+import oqs
+
+# Internal imports
+import timing
+
+ECDH_CURVES = {
+    "P-256": ec.SECP256R1(),
+    "P-384": ec.SECP384R1(),
+    "P-521": ec.SECP521R1(),
+}
+
+SHARED_SECRET_LENGTH = 32
+
+def split_variant(variant):
+    """
+    Splits a hybrid variant (e.g., "X25519+ML-KEM-768") into its classical
+    and post-quantum parts.
+    """
+    classical, pqc = variant.split("+", 1)
+
+    if classical != "X25519" and classical not in ECDH_CURVES:
+        raise ValueError(f"Unknown classical key exchange {classical}. Available: {['X25519', *ECDH_CURVES]}")
+
+    return classical, pqc
+
+def classical_keypair(classical):
+    if classical == "X25519":
+        sk = x25519.X25519PrivateKey.generate()
+        return sk, sk.public_key().public_bytes_raw()
+
+    sk = ec.generate_private_key(ECDH_CURVES[classical])
+    return sk, sk.public_key().public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+
+def classical_exchange(classical, sk, peer_public_key):
+    if classical == "X25519":
+        return sk.exchange(x25519.X25519PublicKey.from_public_bytes(peer_public_key))
+
+    peer = ec.EllipticCurvePublicKey.from_encoded_point(ECDH_CURVES[classical], peer_public_key)
+    return sk.exchange(ec.ECDH(), peer)
+
+def combine(variant, classical_secret, pqc_secret):
+    """
+    Derives the hybrid shared secret from both shared secrets with HKDF-SHA256.
+    """
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=SHARED_SECRET_LENGTH,
+        salt=None,
+        info=variant.encode("utf-8"),
+    ).derive(classical_secret + pqc_secret)
+
+def generate_keypair(classical, client):
+    """
+    Generates the client's classical and post-quantum keypairs.
+
+    Returns:
+        tuple: The classical secret key and the public keys sent on the wire.
+    """
+    classical_sk, classical_pk = classical_keypair(classical)
+    return classical_sk, (classical_pk, client.generate_keypair())
+
+def encapsulate(variant, classical, server, public_keys):
+    """
+    Encapsulates a hybrid secret to the client's public keys, with an
+    ephemeral classical keypair.
+
+    Returns:
+        tuple: The ciphertexts sent on the wire and the hybrid shared secret.
+    """
+    classical_pk, pqc_pk = public_keys
+
+    ephemeral_sk, ephemeral_pk = classical_keypair(classical)
+    classical_secret = classical_exchange(classical, ephemeral_sk, classical_pk)
+    ciphertext, pqc_secret = server.encap_secret(pqc_pk)
+
+    return (ephemeral_pk, ciphertext), combine(variant, classical_secret, pqc_secret)
+
+def decapsulate(variant, classical, client, classical_sk, ciphertexts):
+    """
+    Decapsulates the hybrid shared secret from the server's ciphertexts.
+    """
+    ephemeral_pk, ciphertext = ciphertexts
+
+    classical_secret = classical_exchange(classical, classical_sk, ephemeral_pk)
+    pqc_secret = client.decap_secret(ciphertext)
+
+    return combine(variant, classical_secret, pqc_secret)
+
+def warm_up_cycle(variant, classical, pqc):
+
+    with oqs.KeyEncapsulation(pqc) as client, oqs.KeyEncapsulation(pqc) as server:
+        classical_sk, public_keys = generate_keypair(classical, client)
+        ciphertexts, shared_secret_server = encapsulate(variant, classical, server, public_keys)
+        decapsulate(variant, classical, client, classical_sk, ciphertexts)
+
+def time_evaluation(variant, runs, warm_up):
+
+    classical, pqc = split_variant(variant)
+
+    # Warm up
+    warm_up_runs = timing.run_warm_up(warm_up_cycle, variant, classical, pqc, warm_up=warm_up)
+
+    time_keypair, time_encrypt, time_decrypt = timing.samples(runs, 3)
+
+    # Runs
+    for i in range(runs):
+
+        with oqs.KeyEncapsulation(pqc) as client, oqs.KeyEncapsulation(pqc) as server:
+
+            # Client generates its classical and post-quantum keypairs
+            (classical_sk, public_keys), elapsed = timing.measure(generate_keypair, classical, client)
+
+            time_keypair[i] = elapsed
+
+            # The server derives the hybrid secret and its ciphertexts from the client's public keys
+            (ciphertexts, shared_secret_server), elapsed = timing.measure(encapsulate, variant, classical, server, public_keys)
+
+            time_encrypt[i] = elapsed
+
+            # The client derives the hybrid secret from the server's ciphertexts
+            shared_secret_client, elapsed = timing.measure(decapsulate, variant, classical, client, classical_sk, ciphertexts)
+
+            time_decrypt[i] = elapsed
+
+            if shared_secret_client != shared_secret_server:
+                print(f"WARNING: Shared secrets differ at iteration {i}!")
+
+    return pd.DataFrame({
+        'variant': [variant] * runs,
+        'keypair': time_keypair,
+        'encrypt': time_encrypt,
+        'decrypt': time_decrypt,
+        'warm_up': [warm_up_runs] * runs
+    })
+
+def size_evaluation(variant, mechanisms_catalog):
+    """
+    Sizes of a hybrid variant, adding the classical public key to the public
+    key and the ephemeral public key to the ciphertext sent on the wire.
+
+    Args:
+        variant (str): Hybrid variant.
+        mechanisms_catalog (dict): KEM catalog with the sizes of the post-quantum part.
+    """
+    classical, pqc = split_variant(variant)
+    pqc_sizes = mechanisms_catalog[pqc]
+
+    classical_sk, classical_pk = classical_keypair(classical)
+    classical_sk_length = 32 if classical == "X25519" else (classical_sk.curve.key_size + 7) // 8
+
+    return {
+        'variant': variant,
+        'nist_level': pqc_sizes['nist_level'],
+        'ciphertext': len(classical_pk) + pqc_sizes['ciphertext'],
+        'public_key': len(classical_pk) + pqc_sizes['public_key'],
+        'secret_key': classical_sk_length + pqc_sizes['secret_key'],
+        'shared_secret': SHARED_SECRET_LENGTH
+    }
+
+def hybrid_mechanisms(oqs_mechanisms, ecdh_mechanisms):
+    """
+    Pairs each post-quantum variant with each classical key exchange of the same level.
+
+    Args:
+        oqs_mechanisms (dict): KEM mechanism groups as returned by `utils.mechanisms_groups`.
+        ecdh_mechanisms (dict): Classical key exchanges by name, each mapping
+            levels to a classical variant (see `rules.ECDH_MECHANISMS`).
+
+    Returns:
+        dict: Mechanism groups named "<ecdh>+<mechanism>", mapping levels to
+        hybrid variants named "<classical>+<variant>".
+    """
+    groups = {}
+
+    for mechanism, variants in oqs_mechanisms.items():
+        for ecdh, curves in ecdh_mechanisms.items():
+            variants_with_levels = {
+                level: f"{curves[level]}+{variant}"
+                for level, variant in variants.items()
+                if level in curves
+            }
+            if variants_with_levels:
+                groups[f"{ecdh}+{mechanism}"] = variants_with_levels
+
+    return groups
@@ -1,32 +1,33 @@
-from time import time
+from functools import partial
+import tempfile
 import pandas as pd
 import oqs
 
-def time_evaluation(variant, runs, warm_up):
+# Internal imports
+import memory
+import resumption
+import timing
 
-    # Warm up
-    for i in range(warm_up):
+def warm_up_cycle(variant):
+
+    with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
         
-        with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
-            
-            # Client generates its keypair
-            public_key_client = client.generate_keypair()
+        # Client generates its keypair
+        public_key_client = client.generate_keypair()
 
-            # Optionally, the secret key can be obtained by calling export_secret_key()
-            # and the client can later be re-instantiated with the key pair:
-            # secret_key_client = client.export_secret_key()
+        # The server encapsulates its secret using the client's public key
+        ciphertext, shared_secret_server = server.encap_secret(public_key_client)
 
-            # Store key pair, wait... (session resumption):
-            # client = oqs.KeyEncapsulation(kemalg, secret_key_client)
+        # The client decapsulates the server's ciphertext to obtain the shared secret
+        client.decap_secret(ciphertext)
 
-            # The server encapsulates its secret using the client's public key
-            ciphertext, shared_secret_server = server.encap_secret(public_key_client)
 
-            # The client decapsulates the server's ciphertext to obtain the shared secret
-            shared_secret_client = client.decap_secret(ciphertext)
+def time_evaluation(variant, runs, warm_up):
 
+    # Warm up
+    warm_up_runs = timing.run_warm_up(warm_up_cycle, variant, warm_up=warm_up)
 
-    time_keypair, time_encrypt, time_decrypt = [], [], []
+    time_keypair, time_encrypt, time_decrypt = timing.samples(runs, 3)
 
     # Runs
     for i in range(runs):
@@ -34,40 +35,239 @@ def time_evaluation(variant, runs, warm_up):
         with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
             
             # Client generates its keypair
-            start_keypair = time()
-            public_key_client = client.generate_keypair()
-            end_keypair = time()
+            public_key_client, elapsed = timing.measure(client.generate_keypair)
 
-            time_keypair.append((end_keypair - start_keypair) * 1000)
+            time_keypair[i] = elapsed
 
-            # Optionally, the secret key can be obtained by calling export_secret_key()
-            # and the client can later be re-instantiated with the key pair:
-            # secret_key_client = client.export_secret_key()
+            # The server encapsulates its secret using the client's public key
+            (ciphertext, shared_secret_server), elapsed = timing.measure(server.encap_secret, public_key_client)
 
-            # Store key pair, wait... (session resumption):
-            # client = oqs.KeyEncapsulation(kemalg, secret_key_client)
+            time_encrypt[i] = elapsed
 
-            # The server encapsulates its secret using the client's public key
-            start_encrypt = time()
+            # The client decapsulates the server's ciphertext to obtain the shared secret
+            shared_secret_client, elapsed = timing.measure(client.decap_secret, ciphertext)
+
+            time_decrypt[i] = elapsed
+
+    return pd.DataFrame({
+        'variant': [variant] * runs,
+        'keypair': time_keypair,
+        'encrypt': time_encrypt,
+        'decrypt': time_decrypt,
+        'warm_up': [warm_up_runs] * runs
+    })
+
+def lifecycle(variant):
+    client, server = oqs.KeyEncapsulation(variant), oqs.KeyEncapsulation(variant)
+    client.free()
+    server.free()
+
+def steady_time_evaluation(variant, runs, warm_up):
+    """
+    Times keypair, encapsulation and decapsulation reusing the same client and
+    server objects across all runs, as long-lived objects would be used.
+    The cost of constructing and freeing a client/server pair is reported
+    separately in the 'lifecycle' column.
+    """
+
+    time_keypair, time_encrypt, time_decrypt, time_lifecycle = timing.samples(runs, 4)
+
+    with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
+
+        def steady_cycle():
+            public_key_client = client.generate_keypair()
             ciphertext, shared_secret_server = server.encap_secret(public_key_client)
-            end_encrypt = time()
+            client.decap_secret(ciphertext)
+            lifecycle(variant)
 
-            time_encrypt.append((end_encrypt - start_encrypt) * 1000)
+        # Warm up
+        warm_up_runs = timing.run_warm_up(steady_cycle, warm_up=warm_up)
 
-            # The client decapsulates the server's ciphertext to obtain the shared secret
-            start_decrypt = time()
-            shared_secret_client = client.decap_secret(ciphertext)
-            end_decrypt = time()
-            
-            time_decrypt.append((end_decrypt - start_decrypt) * 1000)
+        # Runs
+        for i in range(runs):
+
+            public_key_client, elapsed = timing.measure(client.generate_keypair)
+            time_keypair[i] = elapsed
+
+            (ciphertext, shared_secret_server), elapsed = timing.measure(server.encap_secret, public_key_client)
+            time_encrypt[i] = elapsed
+
+            shared_secret_client, elapsed = timing.measure(client.decap_secret, ciphertext)
+            time_decrypt[i] = elapsed
+
+            _, elapsed = timing.measure(lifecycle, variant)
+            time_lifecycle[i] = elapsed
 
     return pd.DataFrame({
         'variant': [variant] * runs,
         'keypair': time_keypair,
         'encrypt': time_encrypt,
-        'decrypt': time_decrypt
+        'decrypt': time_decrypt,
+        'lifecycle': time_lifecycle,
+        'warm_up': [warm_up_runs] * runs
+    })
+
+def batch_time_evaluation(variant, runs, warm_up, min_batch_ns=timing.NS_PER_MS):
+    """
+    Times keypair, encapsulation and decapsulation in batches of operations
+    over a pre-generated keypair and ciphertext, reporting the mean time per
+    operation of each batch.
+    """
+
+    with oqs.KeyEncapsulation(variant) as keygen, oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
+
+        public_key_client = client.generate_keypair()
+        ciphertext, shared_secret_server = server.encap_secret(public_key_client)
+
+        results, warm_up_runs = timing.batch_evaluation(
+            operations={
+                'keypair': (keygen.generate_keypair, ()),
+                'encrypt': (server.encap_secret, (public_key_client,)),
+                'decrypt': (client.decap_secret, (ciphertext,)),
+            },
+            runs=runs,
+            warm_up=warm_up,
+            min_batch_ns=min_batch_ns
+        )
+
+    return pd.DataFrame({'variant': [variant] * runs, **results, 'warm_up': [warm_up_runs] * runs})
+
+def resumption_cycle(variant, path):
+
+    with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
+        public_key_client = client.generate_keypair()
+        ciphertext, shared_secret_server = server.encap_secret(public_key_client)
+        resumption.store_secret_key(path, client.export_secret_key())
+
+    with oqs.KeyEncapsulation(variant, resumption.load_secret_key(path)) as client:
+        client.decap_secret(ciphertext)
+
+def resumption_evaluation(variant, runs, warm_up, dir_keys=None):
+    """
+    Times the session resumption of a client: exporting its secret key,
+    storing it to disk, loading it back and re-instantiating the client with
+    it, followed by the first decapsulation of the resumed client.
+    """
+
+    time_export, time_store, time_load, time_instantiate, time_decrypt = timing.samples(runs, 5)
+
+    with tempfile.TemporaryDirectory(dir=dir_keys) as directory:
+
+        path = resumption.key_file(directory, variant)
+
+        # Warm up
+        warm_up_runs = timing.run_warm_up(resumption_cycle, variant, path, warm_up=warm_up)
+
+        # Runs
+        for i in range(runs):
+
+            with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
+
+                public_key_client = client.generate_keypair()
+                ciphertext, shared_secret_server = server.encap_secret(public_key_client)
+
+                # The client exports its secret key and stores it
+                secret_key_client, elapsed = timing.measure(client.export_secret_key)
+                time_export[i] = elapsed
+
+                _, elapsed = timing.measure(resumption.store_secret_key, path, secret_key_client)
+                time_store[i] = elapsed
+
+            # Session resumption: the client is re-instantiated from the stored key
+            secret_key_client, elapsed = timing.measure(resumption.load_secret_key, path)
+            time_load[i] = elapsed
+
+            client, elapsed = timing.measure(oqs.KeyEncapsulation, variant, secret_key_client)
+            time_instantiate[i] = elapsed
+
+            with client:
+                shared_secret_client, elapsed = timing.measure(client.decap_secret, ciphertext)
+                time_decrypt[i] = elapsed
+
+            if shared_secret_client != shared_secret_server:
+                print(f"WARNING: Shared secrets differ after resumption at iteration {i}!")
+
+    return pd.DataFrame({
+        'variant': [variant] * runs,
+        'export': time_export,
+        'store': time_store,
+        'load': time_load,
+        'instantiate': time_instantiate,
+        'decrypt': time_decrypt,
+        'secret_key_bytes': [len(secret_key_client)] * runs,
+        'warm_up': [warm_up_runs] * runs
     })
 
+def encap_chunk(variant, public_keys):
+    """
+    Encapsulates a secret for each public key of a chunk with a single server.
+
+    Returns:
+        int: Number of encapsulations.
+    """
+
+    with oqs.KeyEncapsulation(variant) as server:
+        for public_key in public_keys:
+            server.encap_secret(public_key)
+
+    return len(public_keys)
+
+def decap_chunk(variant, secret_key, ciphertexts):
+    """
+    Decapsulates a chunk of ciphertexts with a single client re-instantiated from its secret key.
+
+    Returns:
+        int: Number of decapsulations.
+    """
+
+    with oqs.KeyEncapsulation(variant, secret_key) as client:
+        for ciphertext in ciphertexts:
+            client.decap_secret(ciphertext)
+
+    return len(ciphertexts)
+
+def scaling_operations(variant, size):
+    """
+    Pre-generates the inputs of the scaling benchmark: `size` encapsulations
+    to the public key of a client and the `size` resulting ciphertexts to
+    decapsulate.
+
+    Returns:
+        dict: Maps each operation to a picklable function of a chunk of
+        inputs and the list of inputs.
+    """
+
+    with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
+        public_key_client = client.generate_keypair()
+        secret_key_client = client.export_secret_key()
+        ciphertexts = [server.encap_secret(public_key_client)[0] for _ in range(size)]
+
+    return {
+        'encrypt': (partial(encap_chunk, variant), [public_key_client] * size),
+        'decrypt': (partial(decap_chunk, variant, secret_key_client), ciphertexts),
+    }
+
+def memory_evaluation(variant):
+    """
+    Measures the peak RSS delta and Python allocation peak of keypair,
+    encapsulation and decapsulation (see `memory.measure_memory`).
+    """
+
+    # Untimed cycle, so the one-time initialization is not measured
+    warm_up_cycle(variant)
+
+    with oqs.KeyEncapsulation(variant) as client, oqs.KeyEncapsulation(variant) as server:
+
+        public_key_client, rss_keypair, python_keypair = memory.measure_memory(client.generate_keypair)
+        (ciphertext, shared_secret_server), rss_encrypt, python_encrypt = memory.measure_memory(server.encap_secret, public_key_client)
+        shared_secret_client, rss_decrypt, python_decrypt = memory.measure_memory(client.decap_secret, ciphertext)
+
+    return [
+        memory.memory_row(variant, 'keypair', rss_keypair, python_keypair),
+        memory.memory_row(variant, 'encrypt', rss_encrypt, python_encrypt),
+        memory.memory_row(variant, 'decrypt', rss_decrypt, python_decrypt),
+    ]
+
 def size_evaluation(variant):
 
     with oqs.KeyEncapsulation(variant) as kem:
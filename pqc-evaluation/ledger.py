@@ -0,0 +1,89 @@
+import argparse
+import json
+
+# Internal imports
+from rules import TX_PROFILE
+
+SECONDS_PER_DAY = 86_400
+DAYS_PER_YEAR = 365
+
+OUTPUT_TYPES = ("pubkey-hash", "pubkey")
+
+def load_profile(path=None):
+    """
+    Loads a transaction profile, a JSON object overriding some of the fields
+    of the default profile (`rules.TX_PROFILE`).
+
+    Args:
+        path (str, optional): JSON file of the profile. Defaults to None (default profile).
+
+    Returns:
+        dict: The transaction profile.
+
+    Raises:
+        argparse.ArgumentTypeError: If the profile has unknown fields or an invalid output type.
+    """
+    profile = dict(TX_PROFILE)
+
+    if path is None:
+        return profile
+
+    with open(path) as f:
+        custom = json.load(f)
+
+    unknown = set(custom) - set(TX_PROFILE)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown fields in transaction profile {path}: {sorted(unknown)}")
+
+    profile.update(custom)
+
+    if profile["output_type"] not in OUTPUT_TYPES:
+        raise argparse.ArgumentTypeError(f"Invalid output_type {profile['output_type']}. Available: {list(OUTPUT_TYPES)}")
+
+    return profile
+
+def ledger_projection(df_sizes, df_statistics, profile):
+    """
+    Projects the size, growth and bandwidth of a ledger whose transactions
+    are signed with each variant, and the CPU time to verify its blocks.
+
+    With pay-to-pubkey-hash outputs, each output holds a public key hash and
+    each input reveals the public key next to its signature; with pay-to-pubkey
+    outputs, the public key is stored in the output and inputs hold only the
+    signature.
+
+    Args:
+        df_sizes (pd.DataFrame): Sizes of the variants ('variant', 'nist_level',
+            'public_key', 'signature'), as in `size-evaluation.csv`.
+        df_statistics (pd.DataFrame): Statistics of the time evaluation, with
+            the median verification time in milliseconds ('median_verify').
+        profile (dict): Transaction profile, as returned by `load_profile`.
+
+    Returns:
+        pd.DataFrame: One row per variant, with the sizes in bytes, the
+        bandwidths in bits per second and the verification time per block in
+        CPU seconds.
+    """
+    df = df_sizes[['variant', 'nist_level', 'public_key', 'signature']].merge(
+        df_statistics[['variant', 'median_verify']], on='variant', how='left'
+    )
+
+    pubkey_hash = profile["output_type"] == "pubkey-hash"
+
+    df['input_size'] = profile["input_bytes"] + df['signature'] + (df['public_key'] if pubkey_hash else 0)
+    df['output_size'] = profile["output_bytes"] + (profile["hash_bytes"] if pubkey_hash else df['public_key'])
+    df['tx_size'] = profile["base_bytes"] + profile["inputs"] * df['input_size'] + profile["outputs"] * df['output_size']
+
+    tx_per_block = profile["tx_per_second"] * profile["block_interval"]
+
+    df['block_size'] = df['tx_size'] * tx_per_block
+    df['ledger_growth_day'] = df['tx_size'] * profile["tx_per_second"] * SECONDS_PER_DAY
+    df['ledger_growth_year'] = df['ledger_growth_day'] * DAYS_PER_YEAR
+
+    df['tx_bandwidth'] = df['tx_size'] * profile["tx_per_second"] * 8
+    df['block_bandwidth'] = df['block_size'] * 8 / profile["propagation_time"]
+
+    df['verify_cpu_seconds'] = profile["inputs"] * tx_per_block * df['median_verify'] / 1000
+    df['verify_cores'] = df['verify_cpu_seconds'] / profile["block_interval"]
+
+    return df.drop(columns=['median_verify'])
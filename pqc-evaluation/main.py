@@ -1,37 +1,67 @@
-from datetime import datetime
-import pandas as pd
-import oqs
+from functools import partial
+import importlib
 import argparse
 import os
+import re
+import sys
 
 # Internal imports
+#
+# Only lightweight modules are imported at load time, so `--help` and the
+# `--list-*` options start fast. The evaluation modules, which pull in oqs,
+# pandas, numpy and matplotlib, are imported in the code paths that use them
+# (see startup.py).
 import utils
-import kem
-import sig
-import ecdsa
-import plots
-from rules import KEM_MECHANISMS, SIG_MECHANISMS, CURVES
+import corpus
+from rules import KEM_MECHANISMS, SIG_MECHANISMS, CLASSICAL_MECHANISMS, ECDH_MECHANISMS
 
-def save_results(dfs, input_mechanisms, levels, mechanisms_dict=None, columns=None):
+# Raw samples (e.g., "time-evaluation-1000x"), stored in the columnar format
+RAW_RESULT = re.compile(r"-\d+x$")
+
+def result_dirs(input_mechanisms, levels, resume=None):
+
+    if resume:
+        return utils.resume_result_dirs(resume)
 
     mechanisms_str = "_".join(input_mechanisms)
 
     levels_str = "-".join(map(str, levels))
 
-    dir_results, dir_graph = utils.create_result_dirs(f"{mechanisms_str}_levels-{levels_str}")
+    return utils.create_result_dirs(f"{mechanisms_str}_levels-{levels_str}")
+
+def save_results(dfs, dir_results, dir_graph, mechanisms_dict=None, columns=None, show_graph=False, plot_jobs=None, export_csv=False):
+    import plots
+    import store
 
     for key, df in dfs.items():
 
-        f = dir_results.split("/")
+        # Raw samples are exported to CSV only on request
+        if RAW_RESULT.search(key):
+            save_npz(df, f"{dir_results}/{key}.{store.EXTENSION}")
+            if not export_csv:
+                continue
+
         file = f"{dir_results}/{key}.csv"
         save_csv(df, file)
 
-        if mechanisms_dict and key == "time-evaluation-mean-std":
+        if not mechanisms_dict or key != "time-evaluation-mean-std":
+            continue
+
+        # Headless rendering of the in-memory results, in parallel
+        if not show_graph:
+            plots.render_plots(
+                df=df,
+                variants_dict=mechanisms_dict,
+                dir_graph=dir_graph,
+                columns=columns,
+                jobs=plot_jobs,
+            )
+        else:
             plots.generate_plots_from_csv(
                 csv_path=file,
                 variants_dict=mechanisms_dict,
                 dir_graph=dir_graph,
-                columns = columns,
+                columns=columns,
                 show_graph=True,
                 show_values=True,
                 show_erros=True,
@@ -42,47 +72,215 @@ def save_csv(df, file):
     df.to_csv(file, index=False)
     print(f"File {file} was created")
 
+def save_npz(df, file):
+    import store
+
+    store.save_frame(df, file)
+    print(f"File {file} was created")
+
+
+def run_times(mechanisms, oqs_time_evaluation, runs, warm_up, dir_results, ecdsa_time_evaluation=None, jobs=1, schedule_block=None, schedule_seed=0, on_variant=None, params=None):
+    """
+    Runs the time evaluation of every variant of the given mechanisms.
+
+    The results of each variant are written to a checkpoint file in
+    `dir_results` as soon as they complete, and variants that already have a
+    checkpoint there are skipped, so an interrupted evaluation can be resumed.
 
-def run_times(mechanisms, oqs_time_evaluation, runs, warm_up, ecdsa_time_evaluation=None):
+    With `jobs` greater than 1, each variant is dispatched to a process pool
+    whose workers are pinned to dedicated cores, and the per-variant results
+    are merged back in the original order.
 
-    results_times = []
+    With `schedule_block`, the runs of the variants are interleaved in
+    randomized round-robin blocks of `schedule_block` runs (see
+    `schedule.interleaved_evaluation`), and the schedule is recorded in the
+    results directory.
+
+    Args:
+        mechanisms (dict): Mechanism groups as returned by `utils.mechanisms_groups`.
+        oqs_time_evaluation (callable): Time evaluation for the OQS variants.
+        runs (int): Number of executions per variant.
+        warm_up (int): Number of warm up executions per variant.
+        dir_results (str): Directory holding the checkpoints of the variants.
+        ecdsa_time_evaluation (callable, optional): Time evaluation for the ECDSA variants.
+        jobs (int, optional): Number of worker processes. Defaults to 1 (serial).
+        schedule_block (int, optional): Number of consecutive runs of a
+            variant in the interleaved schedule. Defaults to None (sequential).
+        schedule_seed (int, optional): Seed of the interleaved schedule.
+        on_variant (callable, optional): Called with the variant and its time
+            evaluation as soon as each variant is complete (or skipped).
+        params (dict, optional): Parameters the checkpoints are made with
+            (see `checkpoint_params`), recorded next to them.
+
+    Returns:
+        pd.DataFrame: Concatenated time evaluation of all variants.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    import multiprocessing
+    import pandas as pd
+    import checkpoint
+    import schedule
+
+    tasks = []
     for mechanism, variants in mechanisms.items():
-        if mechanism == "ecdsa":
-            for variant in variants.values():
-                results_times.append(ecdsa_time_evaluation(variant=variant, runs=runs, warm_up=warm_up))
+        time_evaluation = ecdsa_time_evaluation if mechanism in CLASSICAL_MECHANISMS else oqs_time_evaluation
+        for variant in variants.values():
+            tasks.append((time_evaluation, variant))
+
+    if params:
+        checkpoint.save_params(dir_results, params)
+
+    def completed(variant, df):
+        checkpoint.save_checkpoint(df, dir_results, variant)
+        if on_variant:
+            on_variant(variant, df)
+
+    pending = []
+    for time_evaluation, variant in tasks:
+        if checkpoint.has_checkpoint(dir_results, variant):
+            print(f"Skipping {variant}, already evaluated in {dir_results}")
+            if on_variant:
+                on_variant(variant, checkpoint.load_checkpoint(dir_results, variant))
         else:
-            for variant in variants.values():
-                results_times.append(oqs_time_evaluation(variant=variant, runs=runs, warm_up=warm_up))
+            pending.append((time_evaluation, variant))
+
+    if schedule_block and pending:
+        order = schedule.interleaved_schedule([variant for _, variant in pending], runs, schedule_block, schedule_seed)
+        schedule.save_schedule(dir_results, order, runs, schedule_block, schedule_seed)
+        schedule.interleaved_evaluation(pending, order, warm_up, on_complete=completed)
+
+    elif jobs == 1:
+        for time_evaluation, variant in pending:
+            completed(variant, time_evaluation(variant=variant, runs=runs, warm_up=warm_up))
+
+    elif pending:
+        cores = utils.isolated_cores(jobs)
+        next_core = multiprocessing.Value("i", 0)
 
-    return pd.concat(results_times)
+        with ProcessPoolExecutor(
+            max_workers=len(cores),
+            initializer=utils.pin_worker,
+            initargs=(cores, next_core)
+        ) as executor:
+            futures = {
+                executor.submit(time_evaluation, variant=variant, runs=runs, warm_up=warm_up): variant
+                for time_evaluation, variant in pending
+            }
+            for future in as_completed(futures):
+                completed(futures[future], future.result())
 
-def run_sizes(mechanisms, sizes_evaluation):
+    return pd.concat(checkpoint.load_checkpoint(dir_results, variant) for _, variant in tasks)
+
+def run_sizes(mechanisms, mechanisms_catalog):
+    import pandas as pd
 
     results_sizes = []
     for mechanism, variants in mechanisms.items():
         for variant in variants.values():
-           results_sizes.append(sizes_evaluation(variant))
+           results_sizes.append(mechanisms_catalog[variant])
 
     return pd.DataFrame(results_sizes)
 
 
-def print_variants(input_mechanisms, oqs_mechanisms, normalizer, nist_levels, oqs_cls, ecds_mechanisms=None):
+def run_blocks(mechanisms, oqs_block_evaluation, ecdsa_block_evaluation=None):
+    import pandas as pd
+
+    results_blocks = []
+    for mechanism, variants in mechanisms.items():
+        block_evaluation = ecdsa_block_evaluation if mechanism in CLASSICAL_MECHANISMS else oqs_block_evaluation
+        for level, variant in variants.items():
+            results_blocks.append(block_evaluation(variant=variant, nist_level=level))
+
+    return pd.concat(results_blocks)
+
+
+def run_scaling(mechanisms, oqs_scaling_evaluation, ecdsa_scaling_evaluation=None):
+    import pandas as pd
+
+    results_scaling = []
+    for mechanism, variants in mechanisms.items():
+        scaling_evaluation = ecdsa_scaling_evaluation if mechanism in CLASSICAL_MECHANISMS else oqs_scaling_evaluation
+        for level, variant in variants.items():
+            results_scaling.append(scaling_evaluation(variant=variant, nist_level=level))
+
+    return pd.concat(results_scaling)
+
+
+def run_memory(mechanisms, oqs_memory_evaluation, ecdsa_memory_evaluation=None):
+    import pandas as pd
+    import memory
+
+    results_memory = []
+    for mechanism, variants in mechanisms.items():
+        memory_evaluation = ecdsa_memory_evaluation if mechanism in CLASSICAL_MECHANISMS else oqs_memory_evaluation
+        for variant in variants.values():
+            results_memory.extend(memory.in_subprocess(memory_evaluation, variant))
+
+    return pd.DataFrame(results_memory)
+
+
+def run_resumption(mechanisms, oqs_resumption_evaluation, ecdsa_resumption_evaluation=None):
+    import pandas as pd
+
+    results_resumption = []
+    for mechanism, variants in mechanisms.items():
+        resumption_evaluation = ecdsa_resumption_evaluation if mechanism in CLASSICAL_MECHANISMS else oqs_resumption_evaluation
+        for variant in variants.values():
+            results_resumption.append(resumption_evaluation(variant=variant))
+
+    return pd.concat(results_resumption)
+
+
+def run_message_sizes(mechanisms, oqs_message_size_evaluation, ecdsa_message_size_evaluation=None):
+    import pandas as pd
+
+    results_message_sizes = []
+    for mechanism, variants in mechanisms.items():
+        message_size_evaluation = ecdsa_message_size_evaluation if mechanism in CLASSICAL_MECHANISMS else oqs_message_size_evaluation
+        for variant in variants.values():
+            results_message_sizes.append(message_size_evaluation(variant=variant))
+
+    return pd.concat(results_message_sizes)
+
+
+def load_catalog(name):
+    """
+    Loads the catalog of the enabled KEM or signature variants.
+
+    The evaluation module (`kem` or `sig`) that measures the sizes of the
+    variants is imported only if the cached catalog has to be rebuilt.
+
+    Args:
+        name (str): "kem" or "sig".
+
+    Returns:
+        dict: Maps each enabled variant to its NIST level and sizes.
+    """
+    import catalog
+    import oqs
+
+    def size_evaluation(variant):
+        return importlib.import_module(name).size_evaluation(variant)
+
+    oqs_mechanisms = oqs.get_enabled_kem_mechanisms if name == "kem" else oqs.get_enabled_sig_mechanisms
+
+    return catalog.load_catalog(name, oqs_mechanisms, size_evaluation)
+
+
+def print_variants(input_mechanisms, mechanisms_catalog, normalizer, nist_levels, ecds_mechanisms=None):
 
     oqs_mechanisms_groups = utils.mechanisms_groups(
         input_mechanisms=input_mechanisms,
-        mechanisms=oqs_mechanisms(),
+        mechanisms_catalog=mechanisms_catalog,
         normalizer=normalizer,
-        nist_levels=nist_levels,
-        oqs_cls=oqs_cls
+        nist_levels=nist_levels
     )
 
-    ecdsa_mechanisms_groups = {}
-    if 'ecdsa' in input_mechanisms:
-        ecdsa_mechanisms_groups = utils.get_ecdsa_mechanisms(
-            input_mechanisms= input_mechanisms,
-            curves=CURVES,
-            nist_levels=nist_levels
-        )
+    ecdsa_mechanisms_groups = utils.get_ecdsa_mechanisms(
+        input_mechanisms=input_mechanisms,
+        classical_mechanisms=CLASSICAL_MECHANISMS,
+        nist_levels=nist_levels
+    )
 
     combine_mechanisms = combine_mechanism_groups(
         input_mechanisms=input_mechanisms,
@@ -96,28 +294,29 @@ def print_variants(input_mechanisms, oqs_mechanisms, normalizer, nist_levels, oq
             print(f"{4 * ' '}{variant} - NIST Level {level}")
 
 
-def compute_mean_std(df, group_by, columns):
+def warm_up_summary(df):
+    """
+    Number of warm up executions run by each variant.
     """
-    Compute mean and standard deviation for specified columns grouped by a key.
+    return df.groupby('variant', sort=False)['warm_up'].first().reset_index()
 
-    Parameters:
-    - df: The input DataFrame.
-    - group_by: Column name to group by (e.g., 'variant').
-    - columns: List of column names to compute mean and std for.
 
-    Returns:
-    - pd.DataFrame: DataFrame with mean and std columns.
+def plot_columns(operations, plot_stat):
     """
-    grouped = df.groupby(group_by)
+    Builds the plotted columns of the statistics DataFrame.
 
-    result = pd.DataFrame()
-    for col in columns:
-        result[f'mean_{col}'] = grouped[col].mean()
-        result[f'std_{col}'] = grouped[col].std()
+    Args:
+        operations (list of tuple): Pairs (operation, label) to plot.
+        plot_stat (str): "mean" plots mean ± std, "median" plots the median
+            with its bootstrap confidence interval.
+
+    Returns:
+        list of tuple: (value_column, error_column(s), label) as expected by `plots.plot`.
+    """
+    if plot_stat == "median":
+        return [(f"median_{op}", (f"ci_low_{op}", f"ci_high_{op}"), label) for op, label in operations]
 
-    # Transform the index into a column
-    result = result.reset_index()
-    return result
+    return [(f"mean_{op}", f"std_{op}", label) for op, label in operations]
 
 
 def combine_mechanism_groups(input_mechanisms, oqs_mechanisms, ecdsa_mechanisms=None):
@@ -146,142 +345,497 @@ def combine_mechanism_groups(input_mechanisms, oqs_mechanisms, ecdsa_mechanisms=
     return combined
 
 
+def select_time_evaluation(module, timing_mode, min_batch_time):
+    """
+    Selects the time evaluation of a module according to the timing mode.
+
+    Args:
+        module: Module exposing `time_evaluation`, `steady_time_evaluation` and
+            `batch_time_evaluation` (`kem` or `sig`).
+        timing_mode (str): "fresh" times one operation per run on new objects,
+            "steady" reuses the same objects across runs, "batch" times batches
+            of operations per run.
+        min_batch_time (float): Minimum duration of a batch, in milliseconds.
+
+    Returns:
+        callable: Time evaluation accepting `variant`, `runs` and `warm_up`.
+    """
+    import timing
+
+    if timing_mode == "batch":
+        return partial(module.batch_time_evaluation, min_batch_ns=int(min_batch_time * timing.NS_PER_MS))
+
+    if timing_mode == "steady":
+        return module.steady_time_evaluation
+
+    return module.time_evaluation
+
+
+def prepare_corpus(path, seed, message_sizes=None):
+    """
+    Generates the message corpus if needed and checks that it fits the largest message.
+
+    Args:
+        path (str): Path of the corpus, or None for the cached corpus of `seed`.
+        seed (int): Seed used to generate the corpus.
+        message_sizes (list of int, optional): Message sizes of the sweep.
+
+    Returns:
+        str: Path of the corpus.
+
+    Raises:
+        argparse.ArgumentTypeError: If the corpus is smaller than the largest message.
+    """
+    largest = max(message_sizes or [corpus.MESSAGE_SIZE])
+    size = max(corpus.DEFAULT_SIZE, 2 * largest)
+
+    if path is None:
+        path = corpus.corpus_path(seed, size)
+
+    if not os.path.exists(path):
+        corpus.generate_corpus(path, seed, size)
+
+    if os.path.getsize(path) < largest:
+        raise argparse.ArgumentTypeError(f"Corpus {path} is smaller than the largest message ({largest} bytes)")
+
+    return path
+
+
+def checkpoint_params(args):
+    """
+    Parameters of the time evaluation that the checkpoints depend on, so a
+    resumed evaluation never mixes samples taken in different ways.
+    """
+    return {
+        "runs": args.runs,
+        "timing_mode": args.timing_mode,
+        "min_batch_time": args.min_batch_time if args.timing_mode == "batch" else None,
+        "target_precision": args.target_precision,
+        "max_runs": args.max_runs if args.target_precision else None,
+        "hybrid": sorted(args.hybrid) if args.hybrid else None,
+        "warm_up": args.warm_up,
+        # The signature benchmarks sign messages from the corpus
+        "corpus": os.path.abspath(args.corpus) if args.sig and args.corpus else None,
+        "corpus_seed": args.corpus_seed if args.sig else None,
+    }
+
+
+def with_adaptive_runs(time_evaluation, target_precision, max_runs):
+    """
+    Wraps a time evaluation to sample until the target precision is reached,
+    if a target precision is given.
+    """
+    import adaptive
+
+    if target_precision is None:
+        return time_evaluation
+
+    return partial(
+        adaptive.adaptive_time_evaluation,
+        time_evaluation=time_evaluation,
+        target_precision=target_precision,
+        max_runs=max_runs
+    )
+
+
 def kem_evaluation(
     input_mechanisms,
-    oqs_mechanisms,
+    mechanisms_catalog,
     normalizer,
     nist_levels,
-    oqs_cls,
     runs,
     warm_up,
-    size_evaluation=None,
-    oqs_time_evaluation=None
+    oqs_time_evaluation=None,
+    oqs_memory_evaluation=None,
+    oqs_resumption_evaluation=None,
+    oqs_scaling_evaluation=None,
+    ecdh_mechanisms=None,
+    metadata=None,
+    jobs=1,
+    schedule_block=None,
+    schedule_seed=0,
+    resume=None,
+    plot_stat="mean",
+    show_graph=False,
+    plot_jobs=None,
+    export_csv=False,
+    metrics_file=None,
+    metrics_server=None,
+    checkpoint_params=None,
 ):
+    import hybrid
+    import metrics
+    import plots
+    import preflight
+    import resumption
+    import scaling
+    import stats
+    import timing
+
+    dir_results, dir_graph = result_dirs(input_mechanisms, nist_levels, resume)
 
-    oqs_mechanisms = oqs_mechanisms()
+    if metadata:
+        preflight.save_metadata(dir_results, metadata)
 
     oqs_mechanisms_groups = utils.mechanisms_groups(
         input_mechanisms=input_mechanisms,
-        mechanisms=oqs_mechanisms,
+        mechanisms_catalog=mechanisms_catalog,
         normalizer=normalizer,
-        nist_levels=nist_levels,
-        oqs_cls=oqs_cls
+        nist_levels=nist_levels
     )
 
-    # time evaluation
-    df_time_evaluation = run_times(
-        mechanisms=oqs_mechanisms_groups,
-        oqs_time_evaluation=oqs_time_evaluation,
-        runs=runs,
-        warm_up=warm_up
-    )
+    # Hybrid key exchange: pair each variant with the classical key exchanges
+    if ecdh_mechanisms:
+        oqs_mechanisms_groups = hybrid.hybrid_mechanisms(oqs_mechanisms_groups, ecdh_mechanisms)
+        mechanisms_catalog = {
+            variant: hybrid.size_evaluation(variant, mechanisms_catalog)
+            for variants in oqs_mechanisms_groups.values()
+            for variant in variants.values()
+        }
+
+    # time evaluation, optionally served live as each variant completes
+    live = metrics.live_metrics("kem", sum(len(variants) for variants in oqs_mechanisms_groups.values()))
+    if metrics_server:
+        metrics.serve(metrics_server, live)
 
-    # Compute mean and std of time evaluation
-    df_time_evaluation_mean_std = compute_mean_std(
-        df=df_time_evaluation,
+    try:
+        df_time_evaluation = run_times(
+            mechanisms=oqs_mechanisms_groups,
+            oqs_time_evaluation=oqs_time_evaluation,
+            runs=runs,
+            warm_up=warm_up,
+            dir_results=dir_results,
+            jobs=jobs,
+            schedule_block=schedule_block,
+            schedule_seed=schedule_seed,
+            on_variant=partial(metrics.add_variant, live),
+            params=checkpoint_params,
+        )
+    finally:
+        if metrics_server:
+            metrics_server.shutdown()
+
+    # The steady timing mode also reports the object lifecycle cost
+    columns = ["keypair", "encrypt", "decrypt"]
+    if "lifecycle" in df_time_evaluation.columns:
+        columns.append("lifecycle")
+
+    # Compute the statistics of time evaluation, in milliseconds
+    df_time_evaluation_mean_std = stats.compute_statistics(
+        df=timing.ns_to_ms(df_time_evaluation, columns),
         group_by='variant',
-        columns=["keypair", "encrypt", "decrypt"]
+        columns=columns
     )
 
     # size evaluation
-    df_size_evaluation = run_sizes(oqs_mechanisms_groups, size_evaluation)
+    df_size_evaluation = run_sizes(oqs_mechanisms_groups, mechanisms_catalog)
 
     dfs = {
         f"time-evaluation-{runs}x": df_time_evaluation,
         "time-evaluation-mean-std": df_time_evaluation_mean_std,
         "size-evaluation": df_size_evaluation,
+        "warm-up": warm_up_summary(df_time_evaluation),
     }
 
+    # memory evaluation
+    if oqs_memory_evaluation:
+        dfs["memory-evaluation"] = run_memory(oqs_mechanisms_groups, oqs_memory_evaluation)
+
+    # session resumption evaluation
+    if oqs_resumption_evaluation:
+        df_resumption_evaluation = run_resumption(oqs_mechanisms_groups, oqs_resumption_evaluation)
+
+        dfs[f"resumption-evaluation-{runs}x"] = df_resumption_evaluation
+        dfs["resumption-evaluation"] = resumption.summarize_resumption(df_resumption_evaluation, "decrypt")
+
+    # thread and process scaling evaluation
+    df_scaling_summary = None
+    if oqs_scaling_evaluation:
+        df_scaling_evaluation = run_scaling(oqs_mechanisms_groups, oqs_scaling_evaluation)
+        df_scaling_summary = scaling.summarize_scaling(df_scaling_evaluation)
+
+        dfs[f"scaling-evaluation-{runs}x"] = df_scaling_evaluation
+        dfs["scaling-evaluation"] = df_scaling_summary
+
+    metrics.save_metrics(
+        dir_results=dir_results,
+        evaluation="kem",
+        runs=runs,
+        df_times=df_time_evaluation,
+        df_statistics=df_time_evaluation_mean_std,
+        df_sizes=df_size_evaluation,
+        textfile=metrics_file,
+    )
+
     save_results(
         dfs=dfs,
-        input_mechanisms=input_mechanisms,
-        levels=nist_levels,
+        dir_results=dir_results,
+        dir_graph=dir_graph,
         mechanisms_dict=oqs_mechanisms_groups,
-        columns=[
-            ("mean_keypair", "std_keypair", "Geração de chaves"),
-            ("mean_encrypt", "std_encrypt", "Encriptação"),
-            ("mean_decrypt", "std_decrypt", "Decriptação"),
-        ]
+        columns=plot_columns([
+            ("keypair", "Geração de chaves"),
+            ("encrypt", "Encriptação"),
+            ("decrypt", "Decriptação"),
+        ], plot_stat),
+        show_graph=show_graph,
+        plot_jobs=plot_jobs,
+        export_csv=export_csv,
     )
 
+    if df_scaling_summary is not None:
+        plots.plot_scaling(
+            df=df_scaling_summary,
+            dir_graph=dir_graph,
+            variants_dict=oqs_mechanisms_groups,
+            show_graph=show_graph,
+            jobs=plot_jobs,
+        )
+
 
 def sig_evaluation(
     input_mechanisms,
-    oqs_mechanisms,
+    mechanisms_catalog,
     normalizer,
     nist_levels,
-    oqs_cls,
     runs,
     warm_up,
-    size_evaluation=None,
     oqs_time_evaluation=None,
     ecdsa_time_evaluation=None,
+    ecdsa_size_evaluation=None,
+    oqs_block_evaluation=None,
+    ecdsa_block_evaluation=None,
+    oqs_memory_evaluation=None,
+    ecdsa_memory_evaluation=None,
+    oqs_message_size_evaluation=None,
+    ecdsa_message_size_evaluation=None,
+    oqs_resumption_evaluation=None,
+    ecdsa_resumption_evaluation=None,
+    oqs_scaling_evaluation=None,
+    ecdsa_scaling_evaluation=None,
+    tx_profile=None,
+    metadata=None,
+    jobs=1,
+    schedule_block=None,
+    schedule_seed=0,
+    resume=None,
+    plot_stat="mean",
+    show_graph=False,
+    plot_jobs=None,
+    export_csv=False,
+    metrics_file=None,
+    metrics_server=None,
+    checkpoint_params=None,
 ):
+    import block
+    import ledger
+    import metrics
+    import plots
+    import preflight
+    import resumption
+    import scaling
+    import stats
+    import timing
+
+    dir_results, dir_graph = result_dirs(input_mechanisms, nist_levels, resume)
 
-    oqs_mechanisms = oqs_mechanisms()
+    if metadata:
+        preflight.save_metadata(dir_results, metadata)
 
     oqs_mechanisms_groups = utils.mechanisms_groups(
         input_mechanisms=input_mechanisms,
-        mechanisms=oqs_mechanisms,
+        mechanisms_catalog=mechanisms_catalog,
         normalizer=normalizer,
-        nist_levels=nist_levels,
-        oqs_cls=oqs_cls
+        nist_levels=nist_levels
     )
 
-    ecdsa_mechanisms_groups = {}
-    if 'ecdsa' in input_mechanisms:
-        ecdsa_mechanisms_groups = utils.get_ecdsa_mechanisms(
-            input_mechanisms= input_mechanisms,
-            curves=CURVES,
-            nist_levels=nist_levels
-        )
+    ecdsa_mechanisms_groups = utils.get_ecdsa_mechanisms(
+        input_mechanisms=input_mechanisms,
+        classical_mechanisms=CLASSICAL_MECHANISMS,
+        nist_levels=nist_levels
+    )
 
     combine_mechanisms = combine_mechanism_groups(
         input_mechanisms=input_mechanisms,
         oqs_mechanisms=oqs_mechanisms_groups,
-        ecdsa_mechanisms=ecdsa_mechanisms_groups if ecdsa_mechanisms_groups else None,
+        ecdsa_mechanisms=ecdsa_mechanisms_groups,
     )
 
-    # time evaluation
-    df_time_evaluation = run_times(
-        mechanisms=combine_mechanisms,
-        oqs_time_evaluation=oqs_time_evaluation,
-        ecdsa_time_evaluation=ecdsa_time_evaluation,
-        runs=runs,
-        warm_up=warm_up
-    )
+    # time evaluation, optionally served live as each variant completes
+    live = metrics.live_metrics("sig", sum(len(variants) for variants in combine_mechanisms.values()))
+    if metrics_server:
+        metrics.serve(metrics_server, live)
+
+    try:
+        df_time_evaluation = run_times(
+            mechanisms=combine_mechanisms,
+            oqs_time_evaluation=oqs_time_evaluation,
+            ecdsa_time_evaluation=ecdsa_time_evaluation,
+            runs=runs,
+            warm_up=warm_up,
+            dir_results=dir_results,
+            jobs=jobs,
+            schedule_block=schedule_block,
+            schedule_seed=schedule_seed,
+            on_variant=partial(metrics.add_variant, live),
+            params=checkpoint_params,
+        )
+    finally:
+        if metrics_server:
+            metrics_server.shutdown()
 
-    # Compute mean and std of time evaluation
-    df_time_evaluation_mean_std = compute_mean_std(
-        df=df_time_evaluation,
+    # The steady timing mode also reports the object lifecycle cost
+    columns = ["keypair", "sign", "verify"]
+    if "lifecycle" in df_time_evaluation.columns:
+        columns.append("lifecycle")
+
+    # Compute the statistics of time evaluation, in milliseconds
+    df_time_evaluation_mean_std = stats.compute_statistics(
+        df=timing.ns_to_ms(df_time_evaluation, columns),
         group_by='variant',
-        columns=["keypair", "sign", "verify"]
+        columns=columns
     )
     
     # size evaluation
-    df_size_evaluation = run_sizes(oqs_mechanisms_groups, size_evaluation)
+    sizes_catalog = dict(mechanisms_catalog)
+    if ecdsa_size_evaluation:
+        for variants in ecdsa_mechanisms_groups.values():
+            for variant in variants.values():
+                sizes_catalog[variant] = ecdsa_size_evaluation(variant)
+
+    df_size_evaluation = run_sizes(
+        combine_mechanisms if ecdsa_size_evaluation else oqs_mechanisms_groups,
+        sizes_catalog
+    )
 
     dfs = {
         f"time-evaluation-{runs}x": df_time_evaluation,
         "time-evaluation-mean-std": df_time_evaluation_mean_std,
         "size-evaluation": df_size_evaluation,
+        "warm-up": warm_up_summary(df_time_evaluation),
     }
 
+    # ledger growth and bandwidth projection
+    df_ledger_projection = None
+    if tx_profile:
+        df_ledger_projection = ledger.ledger_projection(df_size_evaluation, df_time_evaluation_mean_std, tx_profile)
+        dfs["ledger-projection"] = df_ledger_projection
+
+    # block validation evaluation
+    if oqs_block_evaluation:
+        df_block_evaluation = run_blocks(
+            mechanisms=combine_mechanisms,
+            oqs_block_evaluation=oqs_block_evaluation,
+            ecdsa_block_evaluation=ecdsa_block_evaluation
+        )
+
+        dfs[f"block-evaluation-{runs}x"] = df_block_evaluation
+        dfs["block-evaluation"] = block.summarize_blocks(df_block_evaluation)
+
+    # memory evaluation
+    if oqs_memory_evaluation:
+        dfs["memory-evaluation"] = run_memory(
+            mechanisms=combine_mechanisms,
+            oqs_memory_evaluation=oqs_memory_evaluation,
+            ecdsa_memory_evaluation=ecdsa_memory_evaluation
+        )
+
+    # session resumption evaluation
+    if oqs_resumption_evaluation:
+        df_resumption_evaluation = run_resumption(
+            mechanisms=combine_mechanisms,
+            oqs_resumption_evaluation=oqs_resumption_evaluation,
+            ecdsa_resumption_evaluation=ecdsa_resumption_evaluation
+        )
+
+        dfs[f"resumption-evaluation-{runs}x"] = df_resumption_evaluation
+        dfs["resumption-evaluation"] = resumption.summarize_resumption(df_resumption_evaluation, "sign")
+
+    # thread and process scaling evaluation
+    df_scaling_summary = None
+    if oqs_scaling_evaluation:
+        df_scaling_evaluation = run_scaling(
+            mechanisms=combine_mechanisms,
+            oqs_scaling_evaluation=oqs_scaling_evaluation,
+            ecdsa_scaling_evaluation=ecdsa_scaling_evaluation
+        )
+        df_scaling_summary = scaling.summarize_scaling(df_scaling_evaluation)
+
+        dfs[f"scaling-evaluation-{runs}x"] = df_scaling_evaluation
+        dfs["scaling-evaluation"] = df_scaling_summary
+
+    # message size evaluation
+    df_message_size_summary = None
+    if oqs_message_size_evaluation:
+        df_message_size_evaluation = run_message_sizes(
+            mechanisms=combine_mechanisms,
+            oqs_message_size_evaluation=oqs_message_size_evaluation,
+            ecdsa_message_size_evaluation=ecdsa_message_size_evaluation
+        )
+        df_message_size_summary = stats.summarize_message_sizes(df_message_size_evaluation)
+
+        dfs[f"message-size-evaluation-{runs}x"] = df_message_size_evaluation
+        dfs["message-size-evaluation"] = df_message_size_summary
+
+    metrics.save_metrics(
+        dir_results=dir_results,
+        evaluation="sig",
+        runs=runs,
+        df_times=df_time_evaluation,
+        df_statistics=df_time_evaluation_mean_std,
+        df_sizes=df_size_evaluation,
+        textfile=metrics_file,
+    )
+
     save_results(
         dfs=dfs,
-        input_mechanisms=input_mechanisms,
-        levels=nist_levels,
+        dir_results=dir_results,
+        dir_graph=dir_graph,
         mechanisms_dict=combine_mechanisms,
-        columns=[
-            ("mean_keypair", "std_keypair", "Geração de chaves"),
-            ("mean_sign", "std_sign", "Assinatura"),
-            ("mean_verify", "std_verify", "Verificação"),
-        ]
+        columns=plot_columns([
+            ("keypair", "Geração de chaves"),
+            ("sign", "Assinatura"),
+            ("verify", "Verificação"),
+        ], plot_stat),
+        show_graph=show_graph,
+        plot_jobs=plot_jobs,
+        export_csv=export_csv,
     )
 
+    if df_message_size_summary is not None:
+        plots.plot_message_sizes(
+            df=df_message_size_summary,
+            dir_graph=dir_graph,
+            variants_dict=combine_mechanisms,
+            show_graph=show_graph,
+            jobs=plot_jobs,
+        )
+
+    if df_scaling_summary is not None:
+        plots.plot_scaling(
+            df=df_scaling_summary,
+            dir_graph=dir_graph,
+            variants_dict=combine_mechanisms,
+            show_graph=show_graph,
+            jobs=plot_jobs,
+        )
+
+    if df_ledger_projection is not None:
+        plots.plot_ledger_projection(
+            df=df_ledger_projection,
+            dir_graph=dir_graph,
+            variants_dict=combine_mechanisms,
+            show_graph=show_graph,
+            jobs=plot_jobs,
+        )
+
 
 def main():
 
+    # Subcommand comparing the results of two runs
+    if sys.argv[1:2] == ["compare"]:
+        import compare
+        return compare.main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="PQC Evaluation",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -289,13 +843,108 @@ def main():
     parser.add_argument("--kem", help="Input list of KEM algorithms", type=str, nargs="+", choices=list(KEM_MECHANISMS.keys()))
     parser.add_argument("--sig", help="Input list of digital signature algorithms", type=str, nargs="+", choices=list(SIG_MECHANISMS.keys()))
     parser.add_argument("--levels", "-l", help="Nist levels", type=int, choices=range(1, 6), default=(range(1,6)), nargs="+")
-    parser.add_argument("--runs", "-r", help="Number of executions", type=utils.positive_int, default=1)
-    parser.add_argument("--warm-up", "-wp", help="Number of executions warm up", type=utils.non_negative_int, default=0)
+    parser.add_argument("--runs", "-r", help="Number of executions (minimum number with --target-precision)", type=utils.positive_int, default=1)
+    parser.add_argument("--target-precision", help="Keep sampling each variant until the relative half-width of the median 95%% CI of every operation is below this value (e.g., 0.01)", type=utils.positive_float)
+    parser.add_argument("--max-runs", help="Maximum number of executions with --target-precision", type=utils.positive_int, default=100_000)
+    parser.add_argument("--warm-up", "-wp", help="Number of executions warm up, or 'auto' to warm up until the timings are stable", type=utils.warm_up_int, default=0)
+    parser.add_argument("--jobs", "-j", help="Number of variants evaluated in parallel, each worker pinned to a dedicated core", type=utils.positive_int, default=1)
+    parser.add_argument("--schedule", help="sequential: all runs of a variant back-to-back; interleaved: runs of all variants interleaved in randomized round-robin blocks", type=str, choices=["sequential", "interleaved"], default="sequential")
+    parser.add_argument("--schedule-block", help="Number of consecutive runs of a variant in the interleaved schedule", type=utils.positive_int, default=10)
+    parser.add_argument("--schedule-seed", help="Seed of the interleaved schedule, recorded in schedule.json", type=utils.non_negative_int, default=0)
+    parser.add_argument("--timing-mode", help="fresh: one operation per run on new objects; steady: objects reused across runs; batch: mean of a batch of operations per run", type=str, choices=["fresh", "steady", "batch"], default="fresh")
+    parser.add_argument("--min-batch-time", help="Minimum duration of a batch in milliseconds (batch timing mode)", type=utils.positive_float, default=1.0)
+    parser.add_argument("--block-size", help="Number of signed transactions per block in the block validation benchmark (disabled if omitted)", type=utils.positive_int)
+    parser.add_argument("--block-workers", help="Number of threads and processes verifying a block (defaults to the number of CPUs available)", type=utils.positive_int)
+    parser.add_argument("--resume", help="Results directory of an interrupted evaluation; variants already evaluated there are skipped", type=str)
+    parser.add_argument("--plot-stat", help="mean: plot mean ± std; median: plot median with its bootstrap 95%% confidence interval", type=str, choices=["mean", "median"], default="mean")
+    parser.add_argument("--memory", help="Also measure the peak RSS delta and Python allocations of each operation, one subprocess per variant", action="store_true")
+    parser.add_argument("--message-sizes", help="Message sizes in bytes of the signature message-size sweep, with optional K/M suffix (e.g., 32 256 4K 1M)", type=utils.size_bytes, nargs="+")
+    parser.add_argument("--corpus", help="Message corpus file of the signature benchmarks, generated with --corpus-seed if missing (defaults to a cached corpus)", type=str)
+    parser.add_argument("--corpus-seed", help="Seed of the generated message corpus", type=utils.non_negative_int, default=corpus.DEFAULT_SEED)
+    parser.add_argument("--resumption", help="Also time the session resumption: exporting the secret key, storing it to disk, loading it and re-instantiating the decapsulator/signer", action="store_true")
+    parser.add_argument("--key-dir", help="Directory where the secret keys are stored by --resumption (defaults to the system temporary directory)", type=str)
+    parser.add_argument("--scaling", help="Also measure the aggregate throughput of the operations of each variant with 1, 2, 4, ... threads and processes", action="store_true")
+    parser.add_argument("--scaling-workers", help="Largest number of threads and processes of the scaling benchmark (defaults to the number of CPUs available)", type=utils.positive_int)
+    parser.add_argument("--scaling-ops", help="Number of pre-generated operations per run of the scaling benchmark, split among the workers", type=utils.positive_int, default=256)
+    parser.add_argument("--ledger", help="Also project the ledger growth, bandwidth and block verification time of the signature variants", action="store_true")
+    parser.add_argument("--tx-profile", help="JSON file overriding fields of the default transaction profile of --ledger (see TX_PROFILE in rules.py)", type=str)
+    parser.add_argument("--hybrid", help="Evaluate the KEMs as hybrid key exchanges combined with these classical key exchanges", type=str, nargs="+", choices=list(ECDH_MECHANISMS.keys()))
+    parser.add_argument("--csv", help="Also export the raw samples, stored as .npz, to CSV", action="store_true")
+    parser.add_argument("--show-graph", help="Display the plots interactively (rendered serially) instead of rendering them headless in parallel", action="store_true")
+    parser.add_argument("--plot-jobs", help="Number of processes rendering the plots (defaults to the number of CPUs)", type=utils.positive_int)
+    parser.add_argument("--metrics-file", help="Also write the OpenMetrics exposition of the results to this file (e.g., in the directory of the node-exporter textfile collector)", type=str)
+    parser.add_argument("--metrics-port", help="Serve the metrics of the variants already evaluated on http://127.0.0.1:<port>/metrics while the evaluation runs", type=utils.positive_int)
+    parser.add_argument("--cpus", help="Run the benchmark on this CPU affinity set (e.g., 2-5 or 0,2,4)", type=utils.cpu_list)
+    parser.add_argument("--max-load", help="Warn when the 1-minute load average is above this value", type=utils.positive_float, default=1.0)
+    parser.add_argument("--strict", help="Refuse to run when frequency scaling, turbo or high load is detected", action="store_true")
     parser.add_argument("--list-kem", help="List of variants KEM algorithms", action="store_true")
     parser.add_argument("--list-sig", help="List of variants digital signature algorithms", action="store_true")
     
     args = parser.parse_args()
 
+    if args.target_precision and args.max_runs < args.runs:
+        parser.error("--max-runs must be greater than or equal to --runs")
+
+    if args.hybrid and (args.timing_mode != "fresh" or args.memory or args.resumption or args.scaling):
+        parser.error("--hybrid supports only the fresh timing mode, without --memory, --resumption or --scaling")
+
+    if args.schedule == "interleaved" and (args.jobs > 1 or args.target_precision):
+        parser.error("--schedule interleaved runs the variants in a single process, without --jobs or --target-precision")
+
+    if args.schedule == "interleaved" and args.timing_mode != "fresh":
+        parser.error("--schedule interleaved supports only the fresh timing mode, each block is a separate evaluation")
+
+    if args.resume and args.kem and args.sig:
+        parser.error("--resume accepts a single evaluation, use either --kem or --sig")
+
+    # The checkpoints of the resumed directory must sample the same way
+    if args.resume:
+        import checkpoint
+
+        if not os.path.isdir(args.resume):
+            parser.error(f"--resume: results directory not found: {args.resume}")
+
+        mismatches = checkpoint.mismatched_params(args.resume, checkpoint_params(args))
+        if mismatches:
+            parser.error(f"--resume: the checkpoints of {args.resume} were made with " + ", ".join(mismatches))
+
+    # The live metrics port is bound before any result is written
+    metrics_server = None
+    if args.metrics_port and (args.kem or args.sig):
+        import metrics
+
+        try:
+            metrics_server = metrics.bind(args.metrics_port)
+        except OSError as e:
+            parser.error(f"--metrics-port: {e}")
+
+    if args.cpus:
+        try:
+            os.sched_setaffinity(0, args.cpus)
+        except OSError as e:
+            parser.error(f"--cpus: {e}")
+
+    # Each worker of --jobs is pinned to a dedicated core of the affinity set
+    if args.jobs > len(os.sched_getaffinity(0)):
+        parser.error(f"--jobs {args.jobs} exceeds the {len(os.sched_getaffinity(0))} CPUs available")
+
+    # The pools default to every CPU of the affinity set
+    args.block_workers = args.block_workers or len(os.sched_getaffinity(0))
+    args.scaling_workers = args.scaling_workers or len(os.sched_getaffinity(0))
+
+    metadata = None
+    if args.kem or args.sig:
+        import preflight
+
+        metadata = preflight.collect_metadata()
+        metadata["warnings"] = preflight.noise_warnings(metadata, args.max_load)
+
+        for warning in metadata["warnings"]:
+            print(f"WARNING: {warning}")
+
+        if args.strict and metadata["warnings"]:
+            parser.error("refusing to run under --strict: " + "; ".join(metadata["warnings"]))
+
     if args.list_kem:
         print("List of KEM algorithm variants")
         # print(oqs.get_enabled_kem_mechanisms())
@@ -303,10 +952,9 @@ def main():
 
         print_variants(
             input_mechanisms=KEM_MECHANISMS.keys(),
-            oqs_mechanisms=oqs.get_enabled_kem_mechanisms,
+            mechanisms_catalog=load_catalog("kem"),
             normalizer=KEM_MECHANISMS,
-            nist_levels=args.levels,
-            oqs_cls=oqs.KeyEncapsulation
+            nist_levels=args.levels
         )
 
     if args.list_sig:
@@ -316,38 +964,130 @@ def main():
 
         print_variants(
             input_mechanisms=SIG_MECHANISMS.keys(),
-            oqs_mechanisms=oqs.get_enabled_sig_mechanisms,
+            mechanisms_catalog=load_catalog("sig"),
             normalizer=SIG_MECHANISMS,
-            nist_levels=args.levels,
-            oqs_cls=oqs.Signature
+            nist_levels=args.levels
         )
 
+    scaling_params = dict(size=args.scaling_ops, runs=args.runs, warm_up=args.warm_up, max_workers=args.scaling_workers)
+
     if args.kem:
+        import hybrid
+        import kem
+        import scaling
+
         kem_evaluation(
             input_mechanisms=args.kem,
-            oqs_mechanisms=oqs.get_enabled_kem_mechanisms,
+            mechanisms_catalog=load_catalog("kem"),
             normalizer=KEM_MECHANISMS,
             nist_levels=args.levels,
-            oqs_cls=oqs.KeyEncapsulation,      
-            oqs_time_evaluation=kem.time_evaluation,
+            oqs_time_evaluation=with_adaptive_runs(
+                hybrid.time_evaluation if args.hybrid else select_time_evaluation(kem, args.timing_mode, args.min_batch_time),
+                args.target_precision,
+                args.max_runs
+            ),
+            oqs_memory_evaluation=kem.memory_evaluation if args.memory else None,
+            oqs_resumption_evaluation=partial(kem.resumption_evaluation, runs=args.runs, warm_up=args.warm_up, dir_keys=args.key_dir) if args.resumption else None,
+            oqs_scaling_evaluation=partial(scaling.scaling_evaluation, scaling_operations=kem.scaling_operations, **scaling_params) if args.scaling else None,
+            ecdh_mechanisms={ecdh: ECDH_MECHANISMS[ecdh] for ecdh in args.hybrid} if args.hybrid else None,
             runs=args.runs,
             warm_up=args.warm_up,
-            size_evaluation=kem.size_evaluation,
+            metadata=metadata,
+            jobs=args.jobs,
+            schedule_block=args.schedule_block if args.schedule == "interleaved" else None,
+            schedule_seed=args.schedule_seed,
+            resume=args.resume,
+            plot_stat=args.plot_stat,
+            show_graph=args.show_graph,
+            plot_jobs=args.plot_jobs,
+            export_csv=args.csv,
+            metrics_file=args.metrics_file,
+            metrics_server=metrics_server,
+            checkpoint_params=checkpoint_params(args),
         )
 
     if args.sig:
+        import block
+        import ecdsa
+        import scaling
+        import sig
+
+        # Every signature benchmark draws its messages from the same corpus
+        with_corpus = partial(partial, corpus_path=prepare_corpus(args.corpus, args.corpus_seed, args.message_sizes))
+
+        oqs_block_evaluation, ecdsa_block_evaluation = None, None
+        if args.block_size:
+            block_params = dict(size=args.block_size, runs=args.runs, warm_up=args.warm_up, workers=args.block_workers)
+            oqs_block_evaluation = partial(block.block_evaluation, generate_block=with_corpus(sig.generate_block), verify_block=sig.verify_block, **block_params)
+            ecdsa_block_evaluation = partial(block.block_evaluation, generate_block=with_corpus(ecdsa.generate_block), verify_block=ecdsa.verify_block, **block_params)
+
+        oqs_message_size_evaluation, ecdsa_message_size_evaluation = None, None
+        if args.message_sizes:
+            message_size_params = dict(runs=args.runs, warm_up=args.warm_up, message_sizes=args.message_sizes)
+            oqs_message_size_evaluation = with_corpus(sig.message_size_evaluation, **message_size_params)
+            ecdsa_message_size_evaluation = with_corpus(ecdsa.message_size_evaluation, **message_size_params)
+
+        oqs_resumption_evaluation, ecdsa_resumption_evaluation = None, None
+        if args.resumption:
+            resumption_params = dict(runs=args.runs, warm_up=args.warm_up, dir_keys=args.key_dir)
+            oqs_resumption_evaluation = with_corpus(sig.resumption_evaluation, **resumption_params)
+            ecdsa_resumption_evaluation = with_corpus(ecdsa.resumption_evaluation, **resumption_params)
+
+        oqs_scaling_evaluation, ecdsa_scaling_evaluation = None, None
+        if args.scaling:
+            oqs_scaling_evaluation = partial(scaling.scaling_evaluation, scaling_operations=with_corpus(sig.scaling_operations), **scaling_params)
+            ecdsa_scaling_evaluation = partial(scaling.scaling_evaluation, scaling_operations=with_corpus(ecdsa.scaling_operations), **scaling_params)
+
+        tx_profile = None
+        if args.ledger:
+            import ledger
+
+            try:
+                tx_profile = ledger.load_profile(args.tx_profile)
+            except (OSError, ValueError, argparse.ArgumentTypeError) as e:
+                parser.error(f"--tx-profile: {e}")
+
         sig_evaluation(
             input_mechanisms=args.sig,
-            oqs_mechanisms=oqs.get_enabled_sig_mechanisms,
+            mechanisms_catalog=load_catalog("sig"),
             normalizer=SIG_MECHANISMS,
             nist_levels=args.levels,
-            oqs_cls=oqs.Signature,
-            oqs_time_evaluation=sig.time_evaluation,
-            ecdsa_time_evaluation=ecdsa.time_evaluation,
+            oqs_time_evaluation=with_adaptive_runs(
+                with_corpus(select_time_evaluation(sig, args.timing_mode, args.min_batch_time)),
+                args.target_precision,
+                args.max_runs
+            ),
+            ecdsa_time_evaluation=with_adaptive_runs(with_corpus(ecdsa.time_evaluation), args.target_precision, args.max_runs),
+            ecdsa_size_evaluation=ecdsa.size_evaluation,
+            oqs_block_evaluation=oqs_block_evaluation,
+            ecdsa_block_evaluation=ecdsa_block_evaluation,
+            oqs_memory_evaluation=with_corpus(sig.memory_evaluation) if args.memory else None,
+            ecdsa_memory_evaluation=with_corpus(ecdsa.memory_evaluation) if args.memory else None,
+            oqs_message_size_evaluation=oqs_message_size_evaluation,
+            ecdsa_message_size_evaluation=ecdsa_message_size_evaluation,
+            oqs_resumption_evaluation=oqs_resumption_evaluation,
+            ecdsa_resumption_evaluation=ecdsa_resumption_evaluation,
+            oqs_scaling_evaluation=oqs_scaling_evaluation,
+            ecdsa_scaling_evaluation=ecdsa_scaling_evaluation,
+            tx_profile=tx_profile,
             runs=args.runs,
             warm_up=args.warm_up,
-            size_evaluation=sig.size_evaluation,
+            metadata=metadata,
+            jobs=args.jobs,
+            schedule_block=args.schedule_block if args.schedule == "interleaved" else None,
+            schedule_seed=args.schedule_seed,
+            resume=args.resume,
+            plot_stat=args.plot_stat,
+            show_graph=args.show_graph,
+            plot_jobs=args.plot_jobs,
+            export_csv=args.csv,
+            metrics_file=args.metrics_file,
+            metrics_server=metrics_server,
+            checkpoint_params=checkpoint_params(args),
         )
 
+    if metrics_server:
+        metrics_server.server_close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
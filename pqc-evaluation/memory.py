@@ -0,0 +1,96 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import multiprocessing
+import resource
+import tracemalloc
+
+PROC_STATUS = "/proc/self/status"
+PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+def proc_status_bytes(field):
+    """
+    Value of a kilobyte field of /proc/self/status (e.g., VmRSS), in bytes.
+    """
+    with open(PROC_STATUS) as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+
+    raise OSError(f"{field} not found in {PROC_STATUS}")
+
+def reset_peak_rss():
+    """
+    Resets the peak RSS of the process (VmHWM) to its current RSS.
+
+    Returns:
+        bool: Whether the kernel supports resetting the peak (Linux 4.0+).
+    """
+    try:
+        with open(PROC_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def measure_memory(func, *args):
+    """
+    Measures the memory used by a single call.
+
+    The peak RSS delta is the growth of the resident set size of the process
+    during the call, from its RSS before the call to its peak (VmHWM), which
+    is reset before each call so the peak of an earlier operation does not
+    hide the memory of this one. Where the peak cannot be reset, it falls
+    back to the growth of the maximum resident set size
+    (`resource.getrusage`), which only reports memory beyond the peak
+    already reached by the process. The Python peak is the largest amount of
+    memory allocated through the Python allocator during the call
+    (`tracemalloc`).
+
+    The first call of an operation also pays for one-time initialization
+    (e.g., lazily loaded code and tables), so the evaluations run an untimed
+    cycle of every operation before measuring.
+
+    Parameters:
+        func (callable): Operation to measure.
+        *args: Arguments passed to `func`.
+
+    Returns:
+        tuple: The value returned by `func`, the peak RSS delta in bytes and
+        the Python allocation peak in bytes.
+    """
+    if reset_peak_rss():
+        rss_before = proc_status_bytes("VmRSS")
+        peak_rss = partial(proc_status_bytes, "VmHWM")
+    else:
+        # ru_maxrss is reported in kilobytes on Linux
+        peak_rss = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        rss_before = peak_rss()
+
+    # Only the call itself is traced, not the reads of /proc above
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+
+    result = func(*args)
+
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_after = peak_rss()
+
+    return result, rss_after - rss_before, python_peak
+
+def memory_row(variant, operation, rss_peak_delta, python_peak):
+    return {
+        'variant': variant,
+        'operation': operation,
+        'rss_peak_delta': rss_peak_delta,
+        'python_peak': python_peak,
+    }
+
+def in_subprocess(memory_evaluation, variant):
+    """
+    Runs the memory evaluation of a variant in a freshly spawned process, so
+    the peak RSS of one variant does not hide the allocations of the next.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(memory_evaluation, variant).result()
@@ -0,0 +1,297 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import threading
+import numpy as np
+
+# Internal imports
+import timing
+
+METRICS_FILE = "metrics.prom"
+SUMMARY_FILE = "summary.json"
+
+PREFIX = "pqc"
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = (
+    1e-6, 2.5e-6, 5e-6,
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+# Columns of the raw time evaluation that are not operations
+NON_OPERATION_COLUMNS = ("variant", "warm_up")
+
+# Metric families: name -> (type, unit, help)
+FAMILIES = {
+    "operation_latency_seconds": ("histogram", "seconds", "Latency of an operation"),
+    "operations_per_second": ("gauge", None, "Operations per second of a single thread, from the median latency"),
+    "size_bytes": ("gauge", "bytes", "Size of a key, ciphertext, shared secret or signature"),
+    "variants": ("gauge", None, "Number of variants of the evaluation"),
+    "variants_completed": ("gauge", None, "Number of variants whose time evaluation is complete"),
+}
+
+def labels(**values):
+    escaped = (
+        f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for key, value in values.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+def operations(df):
+    return [col for col in df.columns if col not in NON_OPERATION_COLUMNS and df[col].notna().any()]
+
+def time_samples(evaluation, df_times):
+    """
+    Latency histogram and single-thread throughput samples of each variant
+    and operation of a raw time evaluation (nanoseconds).
+
+    Returns:
+        dict: Maps each metric family to its list of sample lines.
+    """
+    samples = {"operation_latency_seconds": [], "operations_per_second": []}
+
+    for variant, df in df_times.groupby("variant", sort=False):
+        for op in operations(df):
+            seconds = np.sort(df[op].dropna().to_numpy(dtype=float)) / (timing.NS_PER_MS * 1000)
+            counts = np.searchsorted(seconds, BUCKETS, side="right")
+            common = dict(evaluation=evaluation, variant=variant, operation=op)
+
+            histogram = samples["operation_latency_seconds"]
+            for bound, count in zip(BUCKETS, counts):
+                histogram.append(f"{PREFIX}_operation_latency_seconds_bucket{labels(**common, le=f'{bound:g}')} {count}")
+            histogram.append(f"{PREFIX}_operation_latency_seconds_bucket{labels(**common, le='+Inf')} {len(seconds)}")
+            histogram.append(f"{PREFIX}_operation_latency_seconds_count{labels(**common)} {len(seconds)}")
+            histogram.append(f"{PREFIX}_operation_latency_seconds_sum{labels(**common)} {seconds.sum():.9g}")
+
+            median = np.median(seconds)
+            if median > 0:
+                samples["operations_per_second"].append(f"{PREFIX}_operations_per_second{labels(**common)} {1 / median:.9g}")
+
+    return samples
+
+def size_samples(evaluation, df_sizes):
+    """
+    Size samples of each variant and field of a size evaluation (bytes).
+
+    Returns:
+        dict: Maps each metric family to its list of sample lines.
+    """
+    lines = []
+    for record in df_sizes.to_dict("records"):
+        for field, value in record.items():
+            if field in ("variant", "nist_level"):
+                continue
+            lines.append(
+                f"{PREFIX}_size_bytes"
+                f"{labels(evaluation=evaluation, variant=record['variant'], nist_level=record['nist_level'], field=field)}"
+                f" {value}"
+            )
+
+    return {"size_bytes": lines}
+
+def progress_samples(evaluation, total, completed):
+    return {
+        "variants": [f"{PREFIX}_variants{labels(evaluation=evaluation)} {total}"],
+        "variants_completed": [f"{PREFIX}_variants_completed{labels(evaluation=evaluation)} {completed}"],
+    }
+
+def render(*samples):
+    """
+    Renders metric samples in the OpenMetrics text format, which the
+    textfile collector of node-exporter also accepts.
+
+    Args:
+        *samples (dict): Maps of metric family to sample lines, merged in order.
+
+    Returns:
+        str: The exposition text.
+    """
+    merged = {}
+    for family_samples in samples:
+        for family, lines in family_samples.items():
+            merged.setdefault(family, []).extend(lines)
+
+    output = []
+    for family, (metric_type, unit, description) in FAMILIES.items():
+        if not merged.get(family):
+            continue
+
+        name = f"{PREFIX}_{family}"
+        output.append(f"# TYPE {name} {metric_type}")
+        if unit:
+            output.append(f"# UNIT {name} {unit}")
+        output.append(f"# HELP {name} {description}")
+        output.extend(merged[family])
+
+    output.append("# EOF")
+    return "\n".join(output) + "\n"
+
+def write_textfile(text, file):
+    """
+    Writes the exposition text atomically, as required by the textfile collector.
+    """
+    tmp = f"{file}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, file)
+    print(f"File {file} was created")
+
+def summary(evaluation, runs, df_statistics, df_sizes):
+    """
+    Structured summary of an evaluation: the sizes of each variant and the
+    latency statistics, in milliseconds, and throughput of each operation.
+
+    Args:
+        evaluation (str): "kem" or "sig".
+        runs (int): Number of executions per variant.
+        df_statistics (pd.DataFrame): Statistics of the time evaluation (`stats.compute_statistics`).
+        df_sizes (pd.DataFrame): Size evaluation.
+
+    Returns:
+        dict: JSON serializable summary.
+    """
+    sizes = {record.pop("variant"): record for record in df_sizes.to_dict("records")}
+    statistics = ("mean", "std", "median", "p90", "p99", "ci_low", "ci_high")
+
+    variants = []
+    for record in df_statistics.to_dict("records"):
+        variant = record["variant"]
+        record_sizes = dict(sizes.get(variant, {}))
+        nist_level = record_sizes.pop("nist_level", None)
+
+        ops = {}
+        for column in record:
+            if not column.startswith("median_"):
+                continue
+            op = column[len("median_"):]
+            ops[op] = {f"{stat}_ms": float(record[f"{stat}_{op}"]) for stat in statistics if f"{stat}_{op}" in record}
+            ops[op]["ops_per_second"] = float(1000 / record[column]) if record[column] > 0 else None
+
+        variants.append({
+            "variant": variant,
+            "nist_level": int(nist_level) if nist_level is not None else None,
+            "sizes": {field: int(value) for field, value in record_sizes.items()},
+            "operations": ops,
+        })
+
+    return {"evaluation": evaluation, "runs": runs, "variants": variants}
+
+def write_summary(summary_dict, file):
+    with open(file, "w") as f:
+        json.dump(summary_dict, f, indent=2)
+    print(f"File {file} was created")
+
+def save_metrics(dir_results, evaluation, runs, df_times, df_statistics, df_sizes, textfile=None):
+    """
+    Writes the OpenMetrics exposition (`metrics.prom`) and the JSON summary
+    (`summary.json`) of a completed evaluation to the results directory.
+
+    Args:
+        dir_results (str): Results directory.
+        evaluation (str): "kem" or "sig".
+        runs (int): Number of executions per variant.
+        df_times (pd.DataFrame): Raw time evaluation, in nanoseconds.
+        df_statistics (pd.DataFrame): Statistics of the time evaluation, in milliseconds.
+        df_sizes (pd.DataFrame): Size evaluation.
+        textfile (str, optional): Also write the exposition to this file,
+            e.g., in the directory of the node-exporter textfile collector.
+    """
+    total = df_times["variant"].nunique()
+    text = render(
+        progress_samples(evaluation, total, total),
+        time_samples(evaluation, df_times),
+        size_samples(evaluation, df_sizes),
+    )
+
+    write_textfile(text, os.path.join(dir_results, METRICS_FILE))
+    if textfile:
+        write_textfile(text, textfile)
+
+    write_summary(summary(evaluation, runs, df_statistics, df_sizes), os.path.join(dir_results, SUMMARY_FILE))
+
+def live_metrics(evaluation, total):
+    """
+    State of the metrics of an evaluation in progress, updated by
+    `add_variant` and rendered by `render_live`.
+    """
+    return {
+        "evaluation": evaluation,
+        "total": total,
+        "completed": 0,
+        "samples": [],
+        "lock": threading.Lock(),
+    }
+
+def add_variant(live, variant, df):
+    """
+    Adds the time evaluation of a variant that has just completed.
+    """
+    samples = time_samples(live["evaluation"], df)
+
+    with live["lock"]:
+        live["samples"].append(samples)
+        live["completed"] += 1
+
+def render_live(live):
+    with live["lock"]:
+        return render(
+            progress_samples(live["evaluation"], live["total"], live["completed"]),
+            *live["samples"]
+        )
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serves the live metrics of the evaluation in progress (`server.live`).
+    """
+
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+
+        live = self.server.live
+        if live is None:
+            self.send_error(503, "No evaluation in progress")
+            return
+
+        body = render_live(live).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def bind(port, host="127.0.0.1"):
+    """
+    Binds the live metrics server, so an unavailable port is reported
+    before the evaluation starts.
+
+    Returns:
+        ThreadingHTTPServer: The bound server, not yet serving.
+
+    Raises:
+        OSError: If the port cannot be bound (e.g., it is already in use).
+    """
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.live = None
+    return server
+
+def serve(server, live):
+    """
+    Serves the live metrics of an evaluation on http://<host>:<port>/metrics
+    from a background thread, until `server.shutdown()`. A server can serve
+    the evaluations of a run one after the other.
+    """
+    server.live = live
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    host, port = server.server_address[:2]
+    print(f"Serving metrics on http://{host}:{port}/metrics")
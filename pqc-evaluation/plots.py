@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 import os
 import numpy as np
 import matplotlib.pyplot as plt
@@ -38,7 +39,13 @@ def plot(
 
     for i, (val_col, err_col, label) in enumerate(columns):
         values = df_all[val_col]
-        errors = df_all[err_col]
+
+        # A pair of columns holds the bounds of an asymmetric interval
+        if isinstance(err_col, tuple):
+            low, high = df_all[err_col[0]], df_all[err_col[1]]
+            errors = np.array([values - low, high - values])
+        else:
+            errors = df_all[err_col]
 
         bars = ax.bar(
             x + (i - (n_columns - 1) / 2) * width,
@@ -67,12 +74,18 @@ def plot(
 
         # error
         if show_errors:            
-            for bar, value, error in zip(bars, values, errors):
-                top = value + error
+            if isinstance(err_col, tuple):
+                tops = values + errors[1]
+                texts = [f"+{high:.3f}/-{low:.3f}" for low, high in errors.T]
+            else:
+                tops = values + errors
+                texts = [f"±{error:.3f}" for error in errors]
+
+            for bar, top, text in zip(bars, tops, texts):
                 ax.text(
                     bar.get_x() + bar.get_width() / 2,
                     top * 1.1,  # error position
-                    f"±{error:.3f}",
+                    text,
                     ha="center",
                     va="bottom",
                     fontsize="large",
@@ -120,6 +133,96 @@ def plot(
         plt.close()
 
 
+def use_headless_backend():
+    plt.switch_backend("Agg")
+
+
+def render_tasks(func, tasks, save_formats=("svg", "png"), show_graph=False, jobs=None):
+    """
+    Renders one figure per task and file format in parallel worker processes
+    with the non-interactive Agg backend, or serially in this process to
+    display them interactively.
+
+    Args:
+        func (callable): Draws and saves a figure, accepting the keyword
+            arguments of a task, `show_graph` and `save_formats`.
+        tasks (list of dict): Keyword arguments of each figure.
+        save_formats (tuple, optional): File formats to save, one worker task per format.
+        show_graph (bool, optional): If True, renders serially and displays the figures.
+        jobs (int, optional): Number of worker processes. Defaults to the number of CPUs.
+    """
+    if show_graph:
+        for task in tasks:
+            func(**task, show_graph=True, save_formats=save_formats)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=use_headless_backend) as executor:
+        futures = [
+            executor.submit(func, **task, show_graph=False, save_formats=(ext,))
+            for task in tasks
+            for ext in save_formats
+        ]
+
+        for future in futures:
+            future.result()
+
+
+def render_plots(
+    df,
+    dir_graph,
+    variants_dict,
+    columns,
+    jobs=None,
+    show_values=True,
+    show_errors=True,
+    show_legend=True,
+    ylabel="Tempo (ms)",
+    yscale="log",
+    figsize=(16, 9),
+    save_formats=("svg", "png"),
+):
+    """
+    Renders the bar plots of every level and format in parallel worker
+    processes with the non-interactive Agg backend, from an in-memory DataFrame.
+
+    Args:
+        df (pd.DataFrame): Benchmark statistics, one row per variant.
+        dir_graph (str): Directory where the plots will be saved.
+        variants_dict (dict): Dictionary mapping levels to lists of variants.
+        columns (list[tuple]): Columns to plot, as in `generate_plots_from_csv`.
+        jobs (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        show_values (bool, optional): If True, displays values on top of the bars.
+        show_errors (bool, optional): If True, displays error values.
+        show_legend (bool, optional): If True, displays the legend.
+        ylabel (str, optional): Label for the Y-axis.
+        yscale (str, optional): Scale for the Y-axis, either "log" or "linear".
+        figsize (tuple, optional): Figure size in inches.
+        save_formats (tuple, optional): File formats to save, one task per level and format.
+    """
+    df = df.set_index("variant") if "variant" in df.columns else df
+    variants_by_level = utils.get_variants_by_level(df, variants_dict)
+
+    tasks = [
+        dict(
+            df_all=df.loc[variants],
+            columns=columns,
+            level=level,
+            dir_graph=dir_graph,
+            yscale=yscale,
+            ylabel=ylabel,
+            ylim=(1e-3, 1e4),
+            figsize=figsize,
+            title=f"Nível {level}",
+            show_values=show_values,
+            show_errors=show_errors,
+            show_legend=show_legend,
+        )
+        for level, variants in variants_by_level.items()
+    ]
+
+    render_tasks(plot, tasks, save_formats=save_formats, jobs=jobs)
+
+
 def generate_plots_from_csv(
     csv_path,
     dir_graph,
@@ -146,7 +249,8 @@ def generate_plots_from_csv(
         dir_graph (str): Directory where the plots will be saved.
         variants_dict (dict): Dictionary mapping levels to lists of variants.
         columns (list[tuple]): List of tuples (value_column, error_column, label) representing 
-            the data to plot.
+            the data to plot. The error column may be a pair (low_column, high_column) with
+            the bounds of an asymmetric interval, such as a confidence interval.
         ylabel (str, optional): Label for the Y-axis. Defaults to "Time (ms)".
         xlabel (str, optional): Label for the X-axis. Defaults to "Algorithms".
         yscale (str, optional): Scale for the Y-axis, either "log" or "linear". Defaults to "log".
@@ -179,3 +283,272 @@ def generate_plots_from_csv(
             show_legend=show_legend,
             save_formats=save_formats
         )
+
+
+def level_tasks(df, variants_dict, **kwargs):
+    """
+    Keyword arguments of the figure of each level, with the rows of its variants.
+    """
+    variants_by_level = utils.get_variants_by_level(df.set_index("variant"), variants_dict)
+
+    return [
+        dict(df=df[df["variant"].isin(variants)], level=level, variants=variants, **kwargs)
+        for level, variants in variants_by_level.items()
+    ]
+
+
+def plot_message_sizes_level(df, level, variants, dir_graph, operations, figsize, show_graph, save_formats):
+
+    fig, axes = plt.subplots(1, len(operations), figsize=figsize, sharey=True)
+    palette = sns.color_palette("tab10", n_colors=len(variants))
+
+    for ax, (op, label) in zip(axes, operations):
+        for color, variant in zip(palette, variants):
+            df_variant = df[df["variant"] == variant]
+            ax.plot(df_variant["message_size"], df_variant[f"median_{op}"], marker="o", label=variant, color=color)
+
+        ax.set_xscale("log", base=2)
+        ax.set_yscale("log")
+        ax.set_title(label, fontsize="xx-large")
+        ax.set_xlabel("Tamanho da mensagem (bytes)", fontsize="large")
+        ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
+
+    axes[0].set_ylabel("Tempo (ms)", fontsize="large")
+    axes[-1].legend(loc="upper left", fontsize="x-large")
+
+    fig.suptitle(f"Nível {level}", fontsize="xx-large")
+    plt.tight_layout()
+
+    for ext in save_formats:
+        file = f"{dir_graph}/message_sizes_level_{level}.{ext}"
+        plt.savefig(file, format=ext)
+        print(f"Graph {file} was created")
+
+    if show_graph:
+        plt.show()
+    else:
+        plt.close()
+
+
+def plot_message_sizes(
+    df,
+    dir_graph,
+    variants_dict,
+    operations=(("sign", "Assinatura"), ("verify", "Verificação")),
+    figsize=(16, 9),
+    show_graph=False,
+    save_formats=("svg", "png"),
+    jobs=None,
+):
+    """
+    Generates, for each level, line plots of the median latency of each
+    operation as a function of the message size.
+
+    Args:
+        df (pd.DataFrame): Summary from `stats.summarize_message_sizes`.
+        dir_graph (str): Directory where the plots will be saved.
+        variants_dict (dict): Dictionary mapping levels to lists of variants.
+        operations (tuple): Pairs (operation, label) to plot, one subplot each.
+        figsize (tuple, optional): Figure size in inches. Defaults to (16, 9).
+        show_graph (bool, optional): If True, displays the plots. Defaults to False.
+        save_formats (tuple, optional): File formats to save. Defaults to ("svg", "png").
+        jobs (int, optional): Number of processes rendering the plots (see `render_tasks`).
+    """
+    tasks = level_tasks(df, variants_dict, dir_graph=dir_graph, operations=operations, figsize=figsize)
+    render_tasks(plot_message_sizes_level, tasks, save_formats=save_formats, show_graph=show_graph, jobs=jobs)
+
+
+def plot_comparison_figure(df, dir_graph, figsize, show_graph, save_formats):
+
+    labels = df["variant"] + " - " + df["operation"]
+    change = df["change"] * 100
+
+    # The speedup CI bounds the change of the median in the opposite direction
+    low = (1 / df["ci_high"] - 1) * 100
+    high = (1 / df["ci_low"] - 1) * 100
+    errors = np.array([change - low, high - change]).clip(min=0)
+
+    colors = [
+        "tab:red" if regression else "tab:green" if significant else "tab:gray"
+        for regression, significant in zip(df["regression"], df["significant"])
+    ]
+
+    y = np.arange(len(df))
+
+    fig, ax = plt.subplots(figsize=figsize)
+
+    ax.barh(y, change, xerr=errors, color=colors, error_kw={"capsize": 3, "ecolor": "black", "elinewidth": 1})
+    ax.axvline(0, color="black", linewidth=1)
+
+    ax.set_yticks(y)
+    ax.set_yticklabels(labels, fontsize="large")
+    ax.invert_yaxis()
+
+    ax.set_xlabel("Variação da mediana (%)", fontsize="large")
+    ax.set_title("Comparação entre execuções", fontsize="xx-large")
+    ax.grid(True, axis="x", linestyle="--", linewidth=0.5, alpha=0.7)
+
+    plt.tight_layout()
+
+    for ext in save_formats:
+        file = f"{dir_graph}/comparison.{ext}"
+        plt.savefig(file, format=ext)
+        print(f"Graph {file} was created")
+
+    if show_graph:
+        plt.show()
+    else:
+        plt.close()
+
+
+def plot_comparison(
+    df,
+    dir_graph,
+    figsize=(16, 9),
+    show_graph=False,
+    save_formats=("svg", "png"),
+    jobs=None,
+):
+    """
+    Generates a horizontal bar plot of the relative change of the median time
+    of each variant and operation between two runs.
+
+    Args:
+        df (pd.DataFrame): Comparison from `compare.compare_times`.
+        dir_graph (str): Directory where the plots will be saved.
+        figsize (tuple, optional): Figure size in inches. Defaults to (16, 9).
+        show_graph (bool, optional): If True, displays the plot. Defaults to False.
+        save_formats (tuple, optional): File formats to save. Defaults to ("svg", "png").
+        jobs (int, optional): Number of processes rendering the plots (see `render_tasks`).
+    """
+    tasks = [dict(df=df, dir_graph=dir_graph, figsize=figsize)]
+    render_tasks(plot_comparison_figure, tasks, save_formats=save_formats, show_graph=show_graph, jobs=jobs)
+
+
+def plot_scaling_level(df, level, variants, dir_graph, figsize, show_graph, save_formats):
+
+    operations = df["operation"].unique()
+    linestyles = {"thread": "-", "process": "--"}
+
+    fig, axes = plt.subplots(1, len(operations), figsize=figsize, squeeze=False)
+    axes = axes[0]
+    palette = sns.color_palette("tab10", n_colors=len(variants))
+
+    for ax, op in zip(axes, operations):
+        for color, variant in zip(palette, variants):
+            for mode, linestyle in linestyles.items():
+                df_line = df[(df["variant"] == variant) & (df["operation"] == op) & (df["mode"] == mode)]
+                ax.plot(df_line["workers"], df_line["ops_per_second"], marker="o", linestyle=linestyle, color=color, label=f"{variant} ({mode})")
+
+        ax.set_xscale("log", base=2)
+        ax.set_yscale("log")
+        ax.set_title(op, fontsize="xx-large")
+        ax.set_xlabel("Número de workers", fontsize="large")
+        ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
+
+    axes[0].set_ylabel("Operações por segundo", fontsize="large")
+    axes[-1].legend(loc="upper left", fontsize="large")
+
+    fig.suptitle(f"Nível {level}", fontsize="xx-large")
+    plt.tight_layout()
+
+    for ext in save_formats:
+        file = f"{dir_graph}/scaling_level_{level}.{ext}"
+        plt.savefig(file, format=ext)
+        print(f"Graph {file} was created")
+
+    if show_graph:
+        plt.show()
+    else:
+        plt.close()
+
+
+def plot_scaling(
+    df,
+    dir_graph,
+    variants_dict,
+    figsize=(16, 9),
+    show_graph=False,
+    save_formats=("svg", "png"),
+    jobs=None,
+):
+    """
+    Generates, for each level, line plots of the aggregate operations per
+    second of each operation as a function of the number of workers, with
+    solid lines for threads and dashed lines for processes.
+
+    Args:
+        df (pd.DataFrame): Summary from `scaling.summarize_scaling`.
+        dir_graph (str): Directory where the plots will be saved.
+        variants_dict (dict): Dictionary mapping levels to lists of variants.
+        figsize (tuple, optional): Figure size in inches. Defaults to (16, 9).
+        show_graph (bool, optional): If True, displays the plots. Defaults to False.
+        save_formats (tuple, optional): File formats to save. Defaults to ("svg", "png").
+        jobs (int, optional): Number of processes rendering the plots (see `render_tasks`).
+    """
+    tasks = level_tasks(df, variants_dict, dir_graph=dir_graph, figsize=figsize)
+    render_tasks(plot_scaling_level, tasks, save_formats=save_formats, show_graph=show_graph, jobs=jobs)
+
+
+def plot_ledger_projection_level(df, level, variants, dir_graph, figsize, show_graph, save_formats):
+
+    df = df.set_index("variant")
+
+    panels = [
+        (df["tx_size"], "Tamanho da transação (bytes)"),
+        (df["ledger_growth_year"] / 1e9, "Crescimento do ledger (GB/ano)"),
+        (df["verify_cpu_seconds"], "Verificação por bloco (CPU s)"),
+    ]
+
+    fig, axes = plt.subplots(1, len(panels), figsize=figsize)
+    palette = sns.color_palette("tab10", n_colors=len(variants))
+
+    for ax, (values, label) in zip(axes, panels):
+        bars = ax.bar(variants, values.loc[variants], color=palette)
+
+        for bar, value in zip(bars, values.loc[variants]):
+            ax.text(bar.get_x() + bar.get_width() / 2, value, f"{value:.3g}", ha="center", va="bottom", fontsize="large")
+
+        ax.set_yscale("log")
+        ax.set_title(label, fontsize="x-large")
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.grid(True, axis="y", linestyle="--", linewidth=0.5, alpha=0.7)
+
+    fig.suptitle(f"Nível {level}", fontsize="xx-large")
+    plt.tight_layout()
+
+    for ext in save_formats:
+        file = f"{dir_graph}/ledger_level_{level}.{ext}"
+        plt.savefig(file, format=ext)
+        print(f"Graph {file} was created")
+
+    if show_graph:
+        plt.show()
+    else:
+        plt.close()
+
+
+def plot_ledger_projection(
+    df,
+    dir_graph,
+    variants_dict,
+    figsize=(16, 9),
+    show_graph=False,
+    save_formats=("svg", "png"),
+    jobs=None,
+):
+    """
+    Generates, for each level, bar plots of the transaction size, the yearly
+    ledger growth and the CPU time to verify a block of each variant.
+
+    Args:
+        df (pd.DataFrame): Projection from `ledger.ledger_projection`.
+        dir_graph (str): Directory where the plots will be saved.
+        variants_dict (dict): Dictionary mapping levels to lists of variants.
+        figsize (tuple, optional): Figure size in inches. Defaults to (16, 9).
+        show_graph (bool, optional): If True, displays the plots. Defaults to False.
+        save_formats (tuple, optional): File formats to save. Defaults to ("svg", "png").
+        jobs (int, optional): Number of processes rendering the plots (see `render_tasks`).
+    """
+    tasks = level_tasks(df, variants_dict, dir_graph=dir_graph, figsize=figsize)
+    render_tasks(plot_ledger_projection_level, tasks, save_formats=save_formats, show_graph=show_graph, jobs=jobs)
@@ -0,0 +1,145 @@
+from datetime import datetime
+import json
+import os
+import platform
+import sys
+import cryptography
+import oqs
+
+METADATA_FILE = "metadata.json"
+
+DIR_CPU = "/sys/devices/system/cpu"
+
+# CPU features that select the optimized implementations of liboqs
+CPU_FEATURES = {
+    "sse2", "sse4_1", "sse4_2", "ssse3", "popcnt", "avx", "avx2", "bmi1", "bmi2",
+    "adx", "aes", "pclmulqdq", "sha_ni", "vaes", "vpclmulqdq", "avx512f",
+    "avx512bw", "avx512dq", "avx512vl", "asimd", "sha1", "sha2", "sha3", "sha512",
+}
+
+def read_file(path):
+    """
+    Contents of a (sysfs or procfs) file, or None if it is not available.
+    """
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def cpuinfo():
+    """
+    Model name and features of the CPU, from the first processor of /proc/cpuinfo.
+    """
+    info = {}
+    for line in (read_file("/proc/cpuinfo") or "").splitlines():
+        key, _, value = line.partition(":")
+        key = key.strip()
+        if key in ("model name", "flags", "Features") and key not in info:
+            info[key] = value.strip()
+
+    flags = (info.get("flags") or info.get("Features") or "").split()
+
+    return {
+        "model": info.get("model name", platform.processor()),
+        "features": sorted(CPU_FEATURES.intersection(flags)),
+    }
+
+def governors(cpus):
+    """
+    Frequency scaling governor of each CPU, or None if cpufreq is not available.
+    """
+    result = {
+        cpu: read_file(f"{DIR_CPU}/cpu{cpu}/cpufreq/scaling_governor")
+        for cpu in cpus
+    }
+    return result if any(result.values()) else None
+
+def turbo():
+    """
+    Whether turbo/boost frequencies are enabled, or None if unknown.
+    """
+    no_turbo = read_file(f"{DIR_CPU}/intel_pstate/no_turbo")
+    if no_turbo is not None:
+        return no_turbo == "0"
+
+    boost = read_file(f"{DIR_CPU}/cpufreq/boost")
+    if boost is not None:
+        return boost == "1"
+
+    return None
+
+def collect_metadata():
+    """
+    Describes the machine and software the benchmark runs on.
+
+    Returns:
+        dict: Host, CPU model and features, CPU affinity, frequency scaling
+        governors, turbo state, load average, library versions and command line.
+    """
+    cpus = sorted(os.sched_getaffinity(0))
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "liboqs": oqs.oqs_version(),
+        "liboqs_python": oqs.oqs_python_version(),
+        "cryptography": cryptography.__version__,
+        "cpu": cpuinfo(),
+        "cpu_count": os.cpu_count(),
+        "cpu_affinity": cpus,
+        "governors": governors(cpus),
+        "turbo": turbo(),
+        "load_average": list(os.getloadavg()),
+        "argv": sys.argv,
+    }
+
+def noise_warnings(metadata, max_load):
+    """
+    Detects the sources of noise of a benchmark run.
+
+    Args:
+        metadata (dict): Metadata from `collect_metadata`.
+        max_load (float): Highest acceptable 1-minute load average.
+
+    Returns:
+        list of str: One message per source of noise detected.
+    """
+    warnings = []
+
+    scaling = {
+        cpu: governor for cpu, governor in (metadata["governors"] or {}).items()
+        if governor not in (None, "performance")
+    }
+    if scaling:
+        warnings.append(f"Frequency scaling enabled: governor {', '.join(sorted(set(scaling.values())))} on CPUs {sorted(scaling)}")
+
+    if metadata["turbo"]:
+        warnings.append("Turbo/boost frequencies enabled")
+
+    load = metadata["load_average"][0]
+    if load > max_load:
+        warnings.append(f"High load: 1-minute load average {load:.2f} above {max_load:.2f}")
+
+    return warnings
+
+def save_metadata(dir_results, metadata):
+    """
+    Writes the metadata to the results directory.
+
+    A resumed evaluation keeps the metadata of the original run and records
+    its own in a timestamped file next to it.
+    """
+    file = os.path.join(dir_results, METADATA_FILE)
+
+    if os.path.exists(file):
+        timestamp = metadata["timestamp"].replace(":", "-")
+        file = os.path.join(dir_results, f"metadata-{timestamp}.json")
+
+    with open(file, "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    print(f"File {file} was created")
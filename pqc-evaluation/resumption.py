@@ -0,0 +1,49 @@
+import os
+
+# Internal imports
+import timing
+
+# Timed phases of a session resumption, followed by the first operation of the
+# re-instantiated object ('decrypt' for KEMs, 'sign' for signatures)
+PHASES = ["export", "store", "load", "instantiate"]
+
+def key_file(dir_keys, variant):
+    return os.path.join(dir_keys, f"{variant}.key")
+
+def store_secret_key(path, secret_key):
+    """
+    Serializes a secret key to disk, as a key store would.
+    """
+    with open(path, "wb") as f:
+        f.write(secret_key)
+        f.flush()
+        os.fsync(f.fileno())
+
+def load_secret_key(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def summarize_resumption(df, operation):
+    """
+    Summarizes the session resumption times per variant.
+
+    Args:
+        df (pd.DataFrame): Samples with 'variant', 'secret_key_bytes', one
+            nanosecond column per phase and one for `operation`.
+        operation (str): First operation of the re-instantiated object.
+
+    Returns:
+        pd.DataFrame: Median time in milliseconds of each phase
+        ('median_<phase>'), of loading and re-instantiating the key
+        ('median_resume') and of the first operation, and the size of the
+        serialized secret key.
+    """
+    columns = PHASES + [operation]
+
+    df = df.assign(resume=df['load'] + df['instantiate'])
+    grouped = df.groupby('variant', sort=False)
+
+    result = (grouped[columns + ['resume']].median() / timing.NS_PER_MS).add_prefix('median_')
+    result.insert(0, 'secret_key_bytes', grouped['secret_key_bytes'].first())
+
+    return result.reset_index()
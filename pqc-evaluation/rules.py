@@ -33,6 +33,12 @@ SIG_MECHANISMS = {
     "ecdsa": {
         "include": ["ecdsa"],
     },
+    "secp256k1": {
+        "include": ["secp256k1"],
+    },
+    "ed25519": {
+        "include": ["ed25519"],
+    },
     "mldsa": {
         "include": ["ml-dsa"],
     },
@@ -96,3 +102,39 @@ CURVES = {
     3: "P-384",
     5: "P-521",
 }
+
+SECP256K1_CURVES = {
+    1: "secp256k1",
+}
+
+ED25519_CURVES = {
+    1: "Ed25519",
+}
+
+# Classical signature mechanisms evaluated with the cryptography package
+CLASSICAL_MECHANISMS = {
+    "ecdsa": CURVES,
+    "secp256k1": SECP256K1_CURVES,
+    "ed25519": ED25519_CURVES,
+}
+
+ECDH_MECHANISMS = {
+    "x25519": {level: "X25519" for level in range(1, 6)},
+    "ecdh": CURVES,
+}
+
+# Default transaction profile of the ledger projection: a Bitcoin-like
+# transaction with pay-to-pubkey-hash outputs. Sizes are in bytes and exclude
+# the signatures, public keys and public key hashes.
+TX_PROFILE = {
+    "inputs": 2,                    # inputs per transaction, one signature each
+    "outputs": 2,                   # outputs per transaction
+    "tx_per_second": 7.0,           # transaction throughput of the ledger
+    "block_interval": 600.0,        # seconds between blocks
+    "propagation_time": 6.0,        # seconds to relay a block to a peer
+    "output_type": "pubkey-hash",   # "pubkey-hash" (key revealed by the input) or "pubkey" (key stored in the output)
+    "base_bytes": 10,               # version, counts and lock time
+    "input_bytes": 41,              # previous output reference, sequence and script length
+    "output_bytes": 9,              # amount and script length
+    "hash_bytes": 20,               # public key hash
+}
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import pandas as pd
+
+# Internal imports
+import block
+import timing
+
+EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+def worker_counts(max_workers):
+    """
+    Powers of two up to `max_workers`, which is always included (e.g., 1, 2, 4, 6).
+    """
+    counts = [1]
+    while counts[-1] * 2 < max_workers:
+        counts.append(counts[-1] * 2)
+
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+
+    return counts
+
+def run_chunks(executor, func, chunks):
+    return list(executor.map(func, chunks))
+
+def scaling_evaluation(variant, nist_level, scaling_operations, size, runs, warm_up, max_workers):
+    """
+    Measures how the operations of a variant scale with the number of threads
+    and processes sharing a fixed amount of work.
+
+    For each mode and number of workers, the `size` pre-generated inputs of
+    each operation are split among the workers, each of which runs its chunk
+    with a single object. The process mode includes the transfer of the
+    chunks to the worker processes.
+
+    Args:
+        variant (str): KEM or signature variant.
+        nist_level (int): Claimed NIST level of the variant.
+        scaling_operations (callable): Pre-generates the inputs of each
+            operation, as `sig.scaling_operations`.
+        size (int): Number of operations per run.
+        runs (int): Number of timed runs per operation, mode and number of workers.
+        warm_up (int or str): Number of untimed runs, or "auto" to detect steady state.
+        max_workers (int): Largest number of threads and processes.
+
+    Returns:
+        pd.DataFrame: One row per timed run, with the time in nanoseconds.
+    """
+
+    operations = scaling_operations(variant, size)
+
+    frames = []
+    for mode, executor_class in EXECUTORS.items():
+        for workers in worker_counts(max_workers):
+
+            with executor_class(max_workers=workers) as executor:
+
+                for operation, (func, inputs) in operations.items():
+                    chunks = block.split_block(inputs, workers)
+
+                    # At least one untimed run, so the pool workers are already running
+                    timing.run_warm_up(run_chunks, executor, func, chunks, warm_up=warm_up if warm_up == "auto" else max(warm_up, 1))
+
+                    time_run, = timing.samples(runs, 1)
+
+                    for i in range(runs):
+                        _, elapsed = timing.measure(run_chunks, executor, func, chunks)
+                        time_run[i] = elapsed
+
+                    frames.append(pd.DataFrame({
+                        'variant': variant,
+                        'nist_level': nist_level,
+                        'operation': operation,
+                        'mode': mode,
+                        'workers': workers,
+                        'operations': len(inputs),
+                        'time': time_run,
+                    }))
+
+    return pd.concat(frames, ignore_index=True)
+
+def summarize_scaling(df):
+    """
+    Summarizes the scaling runs per variant, operation, mode and number of workers.
+
+    Returns:
+        pd.DataFrame: Median time in milliseconds, aggregate operations per
+        second and parallel efficiency, the speedup over a single worker of
+        the same mode divided by the number of workers.
+    """
+    keys = ['variant', 'nist_level', 'operation', 'mode', 'workers']
+    grouped = df.groupby(keys, sort=False)
+
+    result = pd.DataFrame({
+        'operations': grouped['operations'].first(),
+        'median_time': grouped['time'].median() / timing.NS_PER_MS,
+    }).reset_index()
+
+    result['ops_per_second'] = result['operations'] / (result['median_time'] / 1000)
+
+    single_worker = result[result['workers'] == 1].set_index(['variant', 'operation', 'mode'])['ops_per_second']
+    baseline = single_worker.reindex(pd.MultiIndex.from_frame(result[['variant', 'operation', 'mode']])).to_numpy()
+
+    result['efficiency'] = result['ops_per_second'] / (result['workers'] * baseline)
+    return result
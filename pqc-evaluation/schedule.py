@@ -0,0 +1,84 @@
+import json
+import os
+import random
+import pandas as pd
+
+SCHEDULE_FILE = "schedule.json"
+
+def interleaved_schedule(variants, runs, block_runs, seed):
+    """
+    Builds a randomized round-robin schedule of the runs of the variants.
+
+    The runs of each variant are split into blocks of `block_runs` runs, and
+    every round runs one block of each variant in a random order.
+
+    Args:
+        variants (list of str): Variants to schedule.
+        runs (int): Number of runs per variant.
+        block_runs (int): Number of consecutive runs of a variant.
+        seed (int): Seed of the random order of each round.
+
+    Returns:
+        list of tuple: (variant, runs) of each block, in execution order.
+    """
+    rng = random.Random(seed)
+
+    schedule = []
+    for start in range(0, runs, block_runs):
+        order = list(variants)
+        rng.shuffle(order)
+        schedule.extend((variant, min(block_runs, runs - start)) for variant in order)
+
+    return schedule
+
+def interleaved_evaluation(tasks, schedule, warm_up, on_complete):
+    """
+    Runs the time evaluation of several variants interleaved in randomized
+    round-robin blocks, so that a drift of the machine (e.g., thermal
+    throttling or a background job) affects every variant alike.
+
+    Only the first block of each variant is warmed up. Each block is a
+    separate call of the time evaluation, so the timing modes that keep
+    state across runs (steady objects, batch sizes) are not supported.
+
+    Args:
+        tasks (list of tuple): (time_evaluation, variant) of each variant.
+        schedule (list of tuple): (variant, runs) of each block, as returned
+            by `interleaved_schedule`.
+        warm_up (int or str): Number of warm up executions, or "auto".
+        on_complete (callable): Called with each variant and its time
+            evaluation as soon as its last block has run.
+    """
+    evaluations = {variant: time_evaluation for time_evaluation, variant in tasks}
+
+    remaining = {variant: 0 for variant in evaluations}
+    for variant, _ in schedule:
+        remaining[variant] += 1
+
+    blocks = {variant: [] for variant in evaluations}
+    for variant, block in schedule:
+        first = not blocks[variant]
+        blocks[variant].append(evaluations[variant](variant=variant, runs=block, warm_up=warm_up if first else 0))
+
+        remaining[variant] -= 1
+        if remaining[variant] == 0:
+            df = pd.concat(blocks.pop(variant), ignore_index=True)
+            df['warm_up'] = df['warm_up'].iloc[0]
+            on_complete(variant, df)
+
+def save_schedule(dir_results, schedule, runs, block_runs, seed):
+    """
+    Records the seed and execution order of an interleaved evaluation.
+    """
+    file = os.path.join(dir_results, SCHEDULE_FILE)
+
+    with open(file, "w") as f:
+        json.dump({
+            "mode": "interleaved",
+            "seed": seed,
+            "runs": runs,
+            "block_runs": block_runs,
+            "order": [[variant, block] for variant, block in schedule],
+        }, f, indent=2)
+
+    print(f"File {file} was created")
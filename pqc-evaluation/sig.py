@@ -1,76 +1,123 @@
-from time import time
+from functools import partial
+import tempfile
 import pandas as pd
-import random
-import string
 import oqs
 
-def time_evaluation(variant, runs, warm_up):
+# Internal imports
+import corpus
+import memory
+import resumption
+import timing
+
+def warm_up_cycle(variant, message):
+
+    with oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
+
+        # Signer generates its keypair
+        signer_public_key = signer.generate_keypair()
+
+        # Signer signs the message
+        signature = signer.sign(message)
+
+        # Verifier verifies the signature
+        is_valid = verifier.verify(message, signature, signer_public_key)
+
+        if not is_valid:
+            print("WARNING: Verification failed during warm up!")
+
+
+def time_evaluation(variant, runs, warm_up, corpus_path=None):
+
+    messages = corpus.load_corpus(corpus_path)
 
     # Warm up
-    for i in range(warm_up):
+    warm_up_runs = timing.run_warm_up(warm_up_cycle, variant, bytes(corpus.message(messages, 0)), warm_up=warm_up)
+
+    time_keypair, time_sign, time_verify = timing.samples(runs, 3)
+
+    # Runs
+    for i in range(runs):
         
-        message = ''.join(random.choices(string.ascii_letters + string.digits, k=60)).encode("utf-8")
+        # The oqs wrapper only accepts bytes, so the message is copied out of
+        # the corpus here, outside the timed region
+        message = bytes(corpus.message(messages, i))
 
         with oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
 
             # Signer generates its keypair
-            signer_public_key = signer.generate_keypair()
+            signer_public_key, elapsed = timing.measure(signer.generate_keypair)
 
-            # Optionally, the secret key can be obtained by calling export_secret_key()
-            # and the signer can later be re-instantiated with the key pair:
-            # secret_key = signer.export_secret_key()
-
-            # Store key pair, wait... (session resumption):
-            # signer = oqs.Signature(sigalg, secret_key)
+            time_keypair[i] = elapsed
 
             # Signer signs the message
-            signature = signer.sign(message)
+            signature, elapsed = timing.measure(signer.sign, message)
+
+            time_sign[i] = elapsed
 
             # Verifier verifies the signature
-            is_valid = verifier.verify(message, signature, signer_public_key)
+            is_valid, elapsed = timing.measure(verifier.verify, message, signature, signer_public_key)
+
+            time_verify[i] = elapsed
 
             if not is_valid:
                 print(f"WARNING: Verification failed at iteration {i}!")
 
+    return pd.DataFrame({
+        'variant': [variant] * runs,
+        'keypair': time_keypair,
+        'sign': time_sign,
+        'verify': time_verify,
+        'warm_up': [warm_up_runs] * runs
+    })
 
-    time_keypair, time_sign, time_verify = [], [], []
+def lifecycle(variant):
+    signer, verifier = oqs.Signature(variant), oqs.Signature(variant)
+    signer.free()
+    verifier.free()
 
-    # message = "This is the message to sign".encode()
+def steady_time_evaluation(variant, runs, warm_up, corpus_path=None):
+    """
+    Times keypair, signing and verification reusing the same signer and
+    verifier objects across all runs, as long-lived objects would be used.
+    The cost of constructing and freeing a signer/verifier pair is reported
+    separately in the 'lifecycle' column.
+    """
 
-    # Runs
-    for i in range(runs):
-        
-        message = ''.join(random.choices(string.ascii_letters + string.digits, k=60)).encode("utf-8")
+    messages = corpus.load_corpus(corpus_path)
 
-        with oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
+    time_keypair, time_sign, time_verify, time_lifecycle = timing.samples(runs, 4)
 
-            # Signer generates its keypair
-            start_keypair = time()
+    with oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
+
+        def steady_cycle():
+            message = bytes(corpus.message(messages, 0))
             signer_public_key = signer.generate_keypair()
-            end_keypair = time()
+            signature = signer.sign(message)
+            is_valid = verifier.verify(message, signature, signer_public_key)
+            lifecycle(variant)
 
-            time_keypair.append((end_keypair - start_keypair) * 1000)
+            if not is_valid:
+                print("WARNING: Verification failed during warm up!")
 
-            # Optionally, the secret key can be obtained by calling export_secret_key()
-            # and the signer can later be re-instantiated with the key pair:
-            # secret_key = signer.export_secret_key()
+        # Warm up
+        warm_up_runs = timing.run_warm_up(steady_cycle, warm_up=warm_up)
 
-            # Store key pair, wait... (session resumption):
-            # signer = oqs.Signature(sigalg, secret_key)
+        # Runs
+        for i in range(runs):
 
-            # Signer signs the message
-            start_sign = time()
-            signature = signer.sign(message)
-            end_sign = time()
+            message = bytes(corpus.message(messages, i))
 
-            time_sign.append((end_sign - start_sign) * 1000)
+            signer_public_key, elapsed = timing.measure(signer.generate_keypair)
+            time_keypair[i] = elapsed
 
-            # Verifier verifies the signature
-            start_verify = time()
-            is_valid = verifier.verify(message, signature, signer_public_key)
-            end_verify = time()
+            signature, elapsed = timing.measure(signer.sign, message)
+            time_sign[i] = elapsed
+
+            is_valid, elapsed = timing.measure(verifier.verify, message, signature, signer_public_key)
+            time_verify[i] = elapsed
 
-            time_verify.append((end_verify - start_verify) * 1000)
+            _, elapsed = timing.measure(lifecycle, variant)
+            time_lifecycle[i] = elapsed
 
             if not is_valid:
                 print(f"WARNING: Verification failed at iteration {i}!")
@@ -79,9 +126,244 @@ def time_evaluation(variant, runs, warm_up):
         'variant': [variant] * runs,
         'keypair': time_keypair,
         'sign': time_sign,
-        'verify': time_verify
+        'verify': time_verify,
+        'lifecycle': time_lifecycle,
+        'warm_up': [warm_up_runs] * runs
+    })
+
+def batch_time_evaluation(variant, runs, warm_up, min_batch_ns=timing.NS_PER_MS, corpus_path=None):
+    """
+    Times keypair, signing and verification in batches of operations over a
+    pre-generated keypair, message and signature, reporting the mean time per
+    operation of each batch.
+    """
+
+    message = bytes(corpus.message(corpus.load_corpus(corpus_path), 0))
+
+    with oqs.Signature(variant) as keygen, oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
+
+        signer_public_key = signer.generate_keypair()
+        signature = signer.sign(message)
+
+        results, warm_up_runs = timing.batch_evaluation(
+            operations={
+                'keypair': (keygen.generate_keypair, ()),
+                'sign': (signer.sign, (message,)),
+                'verify': (verifier.verify, (message, signature, signer_public_key)),
+            },
+            runs=runs,
+            warm_up=warm_up,
+            min_batch_ns=min_batch_ns
+        )
+
+    return pd.DataFrame({'variant': [variant] * runs, **results, 'warm_up': [warm_up_runs] * runs})
+
+def generate_block(variant, size, corpus_path=None):
+    """
+    Generates a block of `size` transactions, each signed by a distinct signer.
+
+    Returns:
+        list of tuple: (message, signature, public_key) per transaction.
+    """
+
+    messages = corpus.load_corpus(corpus_path)
+
+    block = []
+    for i in range(size):
+        message = bytes(corpus.message(messages, i))
+        with oqs.Signature(variant) as signer:
+            public_key = signer.generate_keypair()
+            block.append((message, signer.sign(message), public_key))
+
+    return block
+
+def verify_block(variant, transactions):
+    """
+    Verifies the transactions of a block with a single verifier.
+
+    Returns:
+        bool: True if every signature is valid.
+    """
+
+    with oqs.Signature(variant) as verifier:
+        return all(
+            verifier.verify(message, signature, public_key)
+            for message, signature, public_key in transactions
+        )
+
+def sign_chunk(variant, secret_key, messages):
+    """
+    Signs a chunk of messages with a single signer re-instantiated from its secret key.
+
+    Returns:
+        int: Number of signed messages.
+    """
+
+    with oqs.Signature(variant, secret_key) as signer:
+        for message in messages:
+            signer.sign(message)
+
+    return len(messages)
+
+def scaling_operations(variant, size, corpus_path=None):
+    """
+    Pre-generates the inputs of the scaling benchmark: `size` messages to
+    sign with one signer and a block of `size` transactions to verify.
+
+    Returns:
+        dict: Maps each operation to a picklable function of a chunk of
+        inputs and the list of inputs.
+    """
+
+    transactions = generate_block(variant, size, corpus_path)
+
+    with oqs.Signature(variant) as signer:
+        signer.generate_keypair()
+        secret_key = signer.export_secret_key()
+
+    return {
+        'sign': (partial(sign_chunk, variant, secret_key), [message for message, _, _ in transactions]),
+        'verify': (partial(verify_block, variant), transactions),
+    }
+
+def message_size_evaluation(variant, runs, warm_up, message_sizes, corpus_path=None):
+    """
+    Times signing and verification of messages of each size in `message_sizes`,
+    reusing a single keypair. Messages are sliced from the corpus.
+    """
+
+    messages = corpus.load_corpus(corpus_path)
+
+    frames = []
+
+    with oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
+
+        signer_public_key = signer.generate_keypair()
+
+        for size in message_sizes:
+
+            def cycle(message):
+                signature = signer.sign(message)
+                verifier.verify(message, signature, signer_public_key)
+
+            timing.run_warm_up(cycle, bytes(corpus.message(messages, 0, size)), warm_up=warm_up)
+
+            time_sign, time_verify = timing.samples(runs, 2)
+
+            for i in range(runs):
+                message = bytes(corpus.message(messages, i, size))
+
+                signature, elapsed = timing.measure(signer.sign, message)
+                time_sign[i] = elapsed
+
+                is_valid, elapsed = timing.measure(verifier.verify, message, signature, signer_public_key)
+                time_verify[i] = elapsed
+
+                if not is_valid:
+                    print(f"WARNING: Verification failed at iteration {i} ({size} bytes)!")
+
+            frames.append(pd.DataFrame({'variant': variant, 'message_size': size, 'sign': time_sign, 'verify': time_verify}))
+
+    return pd.concat(frames, ignore_index=True)
+
+def resumption_cycle(variant, path, message):
+
+    with oqs.Signature(variant) as signer:
+        signer_public_key = signer.generate_keypair()
+        resumption.store_secret_key(path, signer.export_secret_key())
+
+    with oqs.Signature(variant, resumption.load_secret_key(path)) as signer, oqs.Signature(variant) as verifier:
+        signature = signer.sign(message)
+        is_valid = verifier.verify(message, signature, signer_public_key)
+
+        if not is_valid:
+            print("WARNING: Verification failed during warm up!")
+
+def resumption_evaluation(variant, runs, warm_up, dir_keys=None, corpus_path=None):
+    """
+    Times the session resumption of a signer: exporting its secret key,
+    storing it to disk, loading it back and re-instantiating the signer with
+    it, followed by the first signature of the resumed signer.
+    """
+
+    messages = corpus.load_corpus(corpus_path)
+
+    time_export, time_store, time_load, time_instantiate, time_sign = timing.samples(runs, 5)
+
+    with tempfile.TemporaryDirectory(dir=dir_keys) as directory, oqs.Signature(variant) as verifier:
+
+        path = resumption.key_file(directory, variant)
+
+        # Warm up
+        warm_up_runs = timing.run_warm_up(resumption_cycle, variant, path, bytes(corpus.message(messages, 0)), warm_up=warm_up)
+
+        # Runs
+        for i in range(runs):
+
+            message = bytes(corpus.message(messages, i))
+
+            with oqs.Signature(variant) as signer:
+
+                signer_public_key = signer.generate_keypair()
+
+                # The signer exports its secret key and stores it
+                secret_key, elapsed = timing.measure(signer.export_secret_key)
+                time_export[i] = elapsed
+
+                _, elapsed = timing.measure(resumption.store_secret_key, path, secret_key)
+                time_store[i] = elapsed
+
+            # Session resumption: the signer is re-instantiated from the stored key
+            secret_key, elapsed = timing.measure(resumption.load_secret_key, path)
+            time_load[i] = elapsed
+
+            signer, elapsed = timing.measure(oqs.Signature, variant, secret_key)
+            time_instantiate[i] = elapsed
+
+            with signer:
+                signature, elapsed = timing.measure(signer.sign, message)
+                time_sign[i] = elapsed
+
+            if not verifier.verify(message, signature, signer_public_key):
+                print(f"WARNING: Verification failed after resumption at iteration {i}!")
+
+    return pd.DataFrame({
+        'variant': [variant] * runs,
+        'export': time_export,
+        'store': time_store,
+        'load': time_load,
+        'instantiate': time_instantiate,
+        'sign': time_sign,
+        'secret_key_bytes': [len(secret_key)] * runs,
+        'warm_up': [warm_up_runs] * runs
     })
 
+def memory_evaluation(variant, corpus_path=None):
+    """
+    Measures the peak RSS delta and Python allocation peak of keypair,
+    signing and verification (see `memory.measure_memory`).
+    """
+
+    message = bytes(corpus.message(corpus.load_corpus(corpus_path), 0))
+
+    # Untimed cycle, so the one-time initialization is not measured
+    warm_up_cycle(variant, message)
+
+    with oqs.Signature(variant) as signer, oqs.Signature(variant) as verifier:
+
+        signer_public_key, rss_keypair, python_keypair = memory.measure_memory(signer.generate_keypair)
+        signature, rss_sign, python_sign = memory.measure_memory(signer.sign, message)
+        is_valid, rss_verify, python_verify = memory.measure_memory(verifier.verify, message, signature, signer_public_key)
+
+    if not is_valid:
+        print("WARNING: Verification failed during memory evaluation!")
+
+    return [
+        memory.memory_row(variant, 'keypair', rss_keypair, python_keypair),
+        memory.memory_row(variant, 'sign', rss_sign, python_sign),
+        memory.memory_row(variant, 'verify', rss_verify, python_verify),
+    ]
+
 def size_evaluation(variant):
     
     with oqs.Signature(variant) as sig:
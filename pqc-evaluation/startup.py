@@ -0,0 +1,68 @@
+import argparse
+import os
+import subprocess
+import statistics
+import sys
+from time import perf_counter_ns
+
+# Internal imports
+import utils
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+# Modules that must not be imported when main.py is loaded
+HEAVY_MODULES = ["oqs", "pandas", "numpy", "matplotlib", "seaborn", "cryptography"]
+
+def imported_heavy_modules():
+    """
+    Loads main.py in a fresh interpreter and returns the heavy modules it imported.
+    """
+    code = (
+        "import sys, runpy; "
+        f"runpy.run_path({MAIN!r}, run_name='startup'); "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return output.split()
+
+def startup_times(args, runs):
+    """
+    Wall-clock time, in milliseconds, of `runs` invocations of main.py with `args`.
+    """
+    times = []
+    for _ in range(runs):
+        start = perf_counter_ns()
+        subprocess.run([sys.executable, MAIN, *args], check=True, stdout=subprocess.DEVNULL)
+        times.append((perf_counter_ns() - start) / 1e6)
+    return times
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Startup time of the PQC Evaluation CLI",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--runs", "-r", help="Number of invocations", type=utils.positive_int, default=20)
+    parser.add_argument("--budget", help="Maximum median startup time of `main.py --help` in milliseconds", type=utils.positive_float, default=150.0)
+
+    args = parser.parse_args()
+
+    failed = False
+
+    heavy = imported_heavy_modules()
+    if heavy:
+        print(f"main.py imports heavy modules at load time: {', '.join(heavy)}")
+        failed = True
+
+    times = startup_times(["--help"], args.runs)
+    median = statistics.median(times)
+    print(f"main.py --help: median {median:.1f} ms, min {min(times):.1f} ms, max {max(times):.1f} ms ({args.runs} runs)")
+
+    if median > args.budget:
+        print(f"Startup time above the budget of {args.budget:.1f} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
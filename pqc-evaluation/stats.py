@@ -0,0 +1,243 @@
+import math
+import numpy as np
+import pandas as pd
+
+# Internal imports
+import timing
+
+PERCENTILES = {
+    "median": 50,
+    "p90": 90,
+    "p99": 99,
+    "p999": 99.9,
+}
+
+# Upper bound on the number of resampled values held in memory at once
+BOOTSTRAP_CHUNK = 10_000_000
+
+def bootstrap_medians(values, n_bootstrap=1000, rng=None):
+    """
+    Computes the medians of bootstrap resamples of the samples.
+
+    Parameters:
+        values (np.ndarray): 1-D array of samples.
+        n_bootstrap (int): Number of bootstrap resamples.
+        rng (np.random.Generator): Random generator used for resampling.
+
+    Returns:
+        np.ndarray: Median of each resample.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    n = len(values)
+
+    chunk = max(BOOTSTRAP_CHUNK // n, 1)
+    return np.concatenate([
+        np.median(values[rng.integers(0, n, size=(min(chunk, n_bootstrap - start), n))], axis=1)
+        for start in range(0, n_bootstrap, chunk)
+    ])
+
+def bootstrap_median_ci(values, n_bootstrap=1000, confidence=0.95, rng=None):
+    """
+    Computes a percentile bootstrap confidence interval of the median.
+
+    Parameters:
+        values (np.ndarray): 1-D array of samples.
+        n_bootstrap (int): Number of bootstrap resamples.
+        confidence (float): Confidence level of the interval.
+        rng (np.random.Generator): Random generator used for resampling.
+
+    Returns:
+        tuple: Lower and upper bounds of the interval.
+    """
+    medians = bootstrap_medians(values, n_bootstrap, rng)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(medians, [alpha, 1 - alpha])
+    return low, high
+
+def relative_ci_half_width(values, n_bootstrap=200, confidence=0.95, rng=None):
+    """
+    Computes the half-width of the median confidence interval relative to the median.
+
+    Parameters:
+        values (np.ndarray): 1-D array of samples; NaN values are ignored.
+        n_bootstrap (int): Number of bootstrap resamples.
+        confidence (float): Confidence level of the interval.
+        rng (np.random.Generator): Random generator used for resampling.
+
+    Returns:
+        float: Relative half-width, or infinity if the median is zero.
+    """
+    values = values[~np.isnan(values)]
+    median = np.median(values)
+
+    if median == 0:
+        return np.inf
+
+    low, high = bootstrap_median_ci(values, n_bootstrap, confidence, rng)
+    return (high - low) / 2 / median
+
+def bootstrap_speedup_ci(baseline, candidate, n_bootstrap=1000, confidence=0.95, rng=None):
+    """
+    Computes a percentile bootstrap confidence interval of the speedup, the
+    ratio of the baseline median to the candidate median.
+
+    Parameters:
+        baseline (np.ndarray): 1-D array of samples of the baseline.
+        candidate (np.ndarray): 1-D array of samples of the candidate.
+        n_bootstrap (int): Number of bootstrap resamples.
+        confidence (float): Confidence level of the interval.
+        rng (np.random.Generator): Random generator used for resampling.
+
+    Returns:
+        tuple: Lower and upper bounds of the interval.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speedups = bootstrap_medians(baseline, n_bootstrap, rng) / bootstrap_medians(candidate, n_bootstrap, rng)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(speedups, [alpha, 1 - alpha])
+    return low, high
+
+def mann_whitney_u(x, y):
+    """
+    Two-sided Mann-Whitney U test, with the normal approximation corrected
+    for ties and continuity.
+
+    Parameters:
+        x (np.ndarray): 1-D array of samples of the first group.
+        y (np.ndarray): 1-D array of samples of the second group.
+
+    Returns:
+        tuple: U statistic of `x` and the two-sided p-value.
+    """
+    n1, n2 = len(x), len(y)
+    n = n1 + n2
+
+    values = np.concatenate([x, y])
+    order = np.argsort(values, kind="mergesort")
+    sorted_values = values[order]
+
+    # Average ranks (1-based) of tied values
+    _, first, counts = np.unique(sorted_values, return_index=True, return_counts=True)
+    ranks = np.empty(n)
+    ranks[order] = np.repeat(first + (counts + 1) / 2, counts)
+
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - (counts ** 3 - counts).sum() / (n * (n - 1)))
+
+    if variance <= 0:
+        return u, 1.0
+
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    p_value = math.erfc(max(z, 0) / math.sqrt(2))
+
+    return u, min(p_value, 1.0)
+
+def describe(values, n_bootstrap=1000, confidence=0.95, rng=None):
+    """
+    Computes the robust statistics of a set of samples.
+
+    Parameters:
+        values (np.ndarray): 1-D array of samples; NaN values are ignored.
+        n_bootstrap (int): Number of bootstrap resamples of the median CI.
+        confidence (float): Confidence level of the median CI.
+        rng (np.random.Generator): Random generator used for resampling.
+
+    Returns:
+        dict: Statistics keyed by name (mean, std, median, p90, p99, p999,
+        min, mad, ci_low, ci_high, outliers).
+    """
+    values = values[~np.isnan(values)]
+
+    if len(values) == 0:
+        return {}
+
+    percentiles = np.percentile(values, list(PERCENTILES.values()))
+    median = percentiles[0]
+
+    q1, q3 = np.percentile(values, [25, 75])
+    iqr = q3 - q1
+
+    ci_low, ci_high = bootstrap_median_ci(values, n_bootstrap, confidence, rng)
+
+    return {
+        "mean": values.mean(),
+        "std": values.std(ddof=1) if len(values) > 1 else np.nan,
+        **dict(zip(PERCENTILES, percentiles)),
+        "min": values.min(),
+        "mad": np.median(np.abs(values - median)),
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "outliers": int(np.count_nonzero((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr))),
+    }
+
+def compute_statistics(df, group_by, columns, n_bootstrap=1000, confidence=0.95, seed=0):
+    """
+    Computes robust statistics for the specified columns grouped by a key.
+
+    The samples are sorted once by group and each group is processed as a
+    contiguous NumPy slice.
+
+    Parameters:
+        df (pd.DataFrame): The input DataFrame.
+        group_by (str): Column name to group by (e.g., 'variant').
+        columns (list of str): Column names to compute the statistics for.
+        n_bootstrap (int): Number of bootstrap resamples of the median CI.
+        confidence (float): Confidence level of the median CI.
+        seed (int): Seed of the bootstrap resampling.
+
+    Returns:
+        pd.DataFrame: One row per group, with a '<statistic>_<column>' column
+        for each statistic of `describe` and each column, in the order the
+        groups first appear in `df`.
+    """
+    rng = np.random.default_rng(seed)
+
+    keys = df[group_by].to_numpy()
+    groups, first = np.unique(keys, return_index=True)
+    groups = groups[np.argsort(first)]
+
+    codes = pd.Categorical(keys, categories=groups).codes
+    order = np.argsort(codes, kind="stable")
+    values = df[columns].to_numpy(dtype=float)[order]
+    bounds = np.searchsorted(codes[order], np.arange(len(groups) + 1))
+
+    rows = []
+    for i, group in enumerate(groups):
+        group_values = values[bounds[i]:bounds[i + 1]]
+
+        row = {group_by: group}
+        for j, col in enumerate(columns):
+            for name, value in describe(group_values[:, j], n_bootstrap, confidence, rng).items():
+                row[f"{name}_{col}"] = value
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+def summarize_message_sizes(df, operations=("sign", "verify")):
+    """
+    Summarizes the message-size sweep per variant and message size.
+
+    Parameters:
+        df (pd.DataFrame): Samples with 'variant', 'message_size' and one
+            nanosecond column per operation.
+        operations (tuple of str): Operation columns to summarize.
+
+    Returns:
+        pd.DataFrame: Median latency in milliseconds ('median_<op>') and
+        throughput in MB/s ('throughput_<op>') of each operation.
+    """
+    grouped = df.groupby(['variant', 'message_size'], sort=False)
+
+    result = pd.DataFrame(index=grouped.size().index)
+    for op in operations:
+        median_ns = grouped[op].median()
+        result[f'median_{op}'] = median_ns / timing.NS_PER_MS
+        result[f'throughput_{op}'] = result.index.get_level_values('message_size') / median_ns * 1000
+
+    return result.reset_index()
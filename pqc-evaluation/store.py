@@ -0,0 +1,68 @@
+import os
+import numpy as np
+import pandas as pd
+
+EXTENSION = "npz"
+
+# Suffix of the array holding the distinct values of a text column
+CATEGORIES = "__categories"
+
+def to_arrays(df):
+    """
+    Columns of a DataFrame as NumPy arrays. Text columns (e.g., 'variant')
+    hold a few distinct values, so they are stored as integer codes and an
+    array of their distinct values, without pickling.
+    """
+    arrays = {}
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            arrays[col] = df[col].to_numpy()
+        else:
+            codes, categories = pd.factorize(df[col])
+            arrays[col] = codes.astype(np.int32)
+            arrays[f"{col}{CATEGORIES}"] = np.asarray(categories, dtype=str)
+    return arrays
+
+def save_frame(df, file):
+    """
+    Writes a DataFrame column by column to an uncompressed `.npz` file.
+
+    The file is written under a temporary name and then renamed, so an
+    interrupted write never leaves a partial file behind.
+    """
+    tmp = f"{file}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **to_arrays(df))
+    os.replace(tmp, file)
+
+def load_frame(file):
+    """
+    Reads a DataFrame written by `save_frame`, preserving the column order.
+    """
+    with np.load(file) as data:
+        return pd.DataFrame({
+            col: data[f"{col}{CATEGORIES}"][data[col]] if f"{col}{CATEGORIES}" in data.files else data[col]
+            for col in data.files
+            if not col.endswith(CATEGORIES)
+        })
+
+def load_runs(dirs_results, key):
+    """
+    Loads the same result of several runs, e.g. the raw time evaluation of
+    every nightly run for a trend analysis.
+
+    Args:
+        dirs_results (list of str): Results directories.
+        key (str): Name of the result without extension (e.g., "time-evaluation-1000x").
+
+    Returns:
+        pd.DataFrame: Concatenated results, with the directory of each run in
+        a 'run' column.
+    """
+    return pd.concat(
+        [
+            load_frame(os.path.join(dir_results, f"{key}.{EXTENSION}")).assign(run=os.path.basename(os.path.normpath(dir_results)))
+            for dir_results in dirs_results
+        ],
+        ignore_index=True
+    )
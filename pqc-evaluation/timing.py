@@ -0,0 +1,174 @@
+from time import perf_counter_ns
+import numpy as np
+
+NS_PER_MS = 1_000_000
+
+def _noop():
+    pass
+
+def _elapsed(func, *args):
+    start = perf_counter_ns()
+    result = func(*args)
+    end = perf_counter_ns()
+    return result, end - start
+
+def calibrate_overhead(samples=10_000):
+    """
+    Estimates the cost of timing an empty call through `measure`.
+
+    Parameters:
+        samples (int): Number of empty calls to time.
+
+    Returns:
+        int: Median overhead, in nanoseconds.
+    """
+    overheads = sorted(_elapsed(_noop)[1] for _ in range(samples))
+    return overheads[samples // 2]
+
+OVERHEAD_NS = calibrate_overhead()
+
+def measure(func, *args):
+    """
+    Times a single call with `perf_counter_ns`, discounting the timer overhead
+    calibrated at startup.
+
+    Parameters:
+        func (callable): Operation to time.
+        *args: Arguments passed to `func`.
+
+    Returns:
+        tuple: The value returned by `func` and the elapsed time in nanoseconds.
+    """
+    result, elapsed = _elapsed(func, *args)
+    return result, max(elapsed - OVERHEAD_NS, 0)
+
+def samples(runs, operations):
+    """
+    Preallocates the samples of the operations of an evaluation, filled in
+    place by the timing loop.
+
+    Parameters:
+        runs (int): Number of samples per operation.
+        operations (int): Number of operations.
+
+    Returns:
+        list of np.ndarray: One int64 array of `runs` nanosecond samples per operation.
+    """
+    return [np.empty(runs, dtype=np.int64) for _ in range(operations)]
+
+def ns_to_ms(df, columns):
+    """
+    Converts the given nanosecond columns of a DataFrame to milliseconds.
+
+    Parameters:
+        df (pd.DataFrame): DataFrame with integer nanosecond columns.
+        columns (list of str): Columns to convert.
+
+    Returns:
+        pd.DataFrame: Copy of `df` with the columns in milliseconds.
+    """
+    df = df.copy()
+    df[columns] = df[columns] / NS_PER_MS
+    return df
+
+def batch_size(func, *args, min_batch_ns=NS_PER_MS):
+    """
+    Chooses how many calls of an operation are timed per sample, doubling
+    the batch until it lasts at least `min_batch_ns`.
+
+    Parameters:
+        func (callable): Operation to time.
+        *args: Arguments passed to `func`.
+        min_batch_ns (int): Minimum duration of a batch, in nanoseconds.
+
+    Returns:
+        int: Number of calls per batch.
+    """
+    k = 1
+    while measure_batch(func, args, k) * k < min_batch_ns:
+        k *= 2
+    return k
+
+def measure_batch(func, args, k):
+    """
+    Times a batch of `k` calls of an operation.
+
+    Parameters:
+        func (callable): Operation to time.
+        args (tuple): Arguments passed to `func` on every call.
+        k (int): Number of calls in the batch.
+
+    Returns:
+        int: Mean time per call, in nanoseconds.
+    """
+    start = perf_counter_ns()
+    for _ in range(k):
+        func(*args)
+    end = perf_counter_ns()
+    return max(end - start - OVERHEAD_NS, 0) // k
+
+def batch_evaluation(operations, runs, warm_up, min_batch_ns=NS_PER_MS):
+    """
+    Times each operation in batches sized by `batch_size`, one batch per run.
+
+    Parameters:
+        operations (dict): Maps each column name to a tuple (func, args) built
+            on pre-generated keys, ciphertexts or signatures.
+        runs (int): Number of batches recorded per operation.
+        warm_up (int or str): Number of batches discarded per operation, or
+            "auto" to detect steady state (see `run_warm_up`).
+        min_batch_ns (int): Minimum duration of a batch, in nanoseconds.
+
+    Returns:
+        tuple: A dict mapping each column name to the array of per-call means
+        of its batches, and the total number of warm up batches run.
+    """
+    results = {}
+    warm_up_runs = 0
+
+    for name, (func, args) in operations.items():
+        k = batch_size(func, *args, min_batch_ns=min_batch_ns)
+
+        warm_up_runs += run_warm_up(measure_batch, func, args, k, warm_up=warm_up)
+
+        results[name] = np.fromiter((measure_batch(func, args, k) for _ in range(runs)), dtype=np.int64, count=runs)
+
+    return results, warm_up_runs
+
+def run_warm_up(func, *args, warm_up, window=10, tolerance=0.05, max_iterations=10_000):
+    """
+    Runs the warm up iterations of a variant.
+
+    With an integer `warm_up`, exactly that many iterations are run. With
+    "auto", iterations are run until steady state: the median time of the
+    last `window` iterations differs from the median of the `window`
+    iterations before them by at most `tolerance` (relative), or until
+    `max_iterations` is reached.
+
+    Parameters:
+        func (callable): One warm up iteration.
+        *args: Arguments passed to `func`.
+        warm_up (int or str): Number of iterations, or "auto".
+        window (int): Size of the sliding window of the stability test.
+        tolerance (float): Maximum relative difference between the windows' medians.
+        max_iterations (int): Maximum number of iterations with "auto".
+
+    Returns:
+        int: Number of warm up iterations run.
+    """
+    if warm_up != "auto":
+        for _ in range(warm_up):
+            func(*args)
+        return warm_up
+
+    elapsed = []
+    while len(elapsed) < max_iterations:
+        elapsed.append(measure(func, *args)[1])
+
+        if len(elapsed) >= 2 * window:
+            previous = sorted(elapsed[-2 * window:-window])[window // 2]
+            last = sorted(elapsed[-window:])[window // 2]
+            if abs(last - previous) <= tolerance * previous:
+                break
+
+    return len(elapsed)
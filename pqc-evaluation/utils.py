@@ -1,10 +1,10 @@
 import argparse
-import oqs
 import os
 from datetime import datetime
 
 DIR_RESULTS = "results"
 DIR_GRAPH = "graph"
+DIR_CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "pqc-evaluation")
 
 def create_result_dirs(suffix=None):
     
@@ -19,6 +19,17 @@ def create_result_dirs(suffix=None):
 
     return dir_results, dir_graph
 
+def resume_result_dirs(dir_results):
+
+    if not os.path.isdir(dir_results):
+        raise argparse.ArgumentTypeError(f"Results directory not found: {dir_results}")
+
+    dir_graph = os.path.join(dir_results, DIR_GRAPH)
+
+    os.makedirs(dir_graph, exist_ok=True)
+
+    return dir_results, dir_graph
+
 def get_variants_by_level(df, variant_dict):
     csv_variants = set(df.index.to_list())
 
@@ -31,22 +42,24 @@ def get_variants_by_level(df, variant_dict):
 
     return dict(sorted(variants_by_level.items()))
 
-def mechanisms_groups(input_mechanisms, mechanisms, normalizer, nist_levels, oqs_cls):
+def mechanisms_groups(input_mechanisms, mechanisms_catalog, normalizer, nist_levels):
     """
     Filters and groups cryptographic mechanisms based on inclusion/exclusion patterns 
     and maps them to their respective NIST security levels.
 
     For each mechanism in `input_mechanisms`, the function applies normalization rules 
-    defined in the `normalizer` to filter matching mechanisms from the `mechanisms` list.
+    defined in the `normalizer` to filter matching mechanisms from the `mechanisms_catalog`.
     The filtered mechanisms are then classified by their claimed NIST security level 
-    using the `oqs_cls` interface.
+    recorded in the catalog.
 
     Args:
         input_mechanisms (list of str): 
             List of mechanism identifiers to be normalized and grouped.
         
-        mechanisms (list of str): 
-            Complete list of available mechanisms to be filtered.
+        mechanisms_catalog (dict): 
+            Catalog of available mechanisms to be filtered, as returned by
+            `catalog.load_catalog`, mapping each variant to a record with
+            its 'nist_level'.
         
         normalizer (dict): 
             A dictionary defining filtering rules for each mechanism. 
@@ -55,10 +68,6 @@ def mechanisms_groups(input_mechanisms, mechanisms, normalizer, nist_levels, oqs
                 - "include": list or string of substrings that must be present.
                 - "exclude": list or string of substrings that must NOT be present.
         
-        oqs_cls (class): 
-            Callable class that initializes a mechanism instance exposing a 
-            `details` attribute containing the 'claimed_nist_level' key.
-
     Returns:
         dict: 
             Dictionary mapping each input mechanism to its matched variants 
@@ -84,8 +93,8 @@ def mechanisms_groups(input_mechanisms, mechanisms, normalizer, nist_levels, oqs
             - If no matching mechanisms are found for an input mechanism.
 
         ValueError:
-            If a matched mechanism does not provide a 'claimed_nist_level' 
-            in its details.    
+            If a matched mechanism does not provide a 'nist_level' 
+            in the catalog.    
     """
 
     matches = {}
@@ -104,7 +113,7 @@ def mechanisms_groups(input_mechanisms, mechanisms, normalizer, nist_levels, oqs
 
         founds = []
 
-        for mechanism in mechanisms:
+        for mechanism in mechanisms_catalog:
             mechanism_lower = mechanism.lower()
 
             if all(p in mechanism_lower for p in include):
@@ -117,12 +126,11 @@ def mechanisms_groups(input_mechanisms, mechanisms, normalizer, nist_levels, oqs
         
         variants_with_levels = {}
         for variant in founds:
-            with oqs_cls(variant) as oqs_variant:
-                level = oqs_variant.details.get('claimed_nist_level', None)
-                if level is None:
-                    raise ValueError(f"NIST level not found for {variant}")
-                if level in nist_levels:
-                    variants_with_levels[level] = variant
+            level = mechanisms_catalog[variant].get('nist_level', None)
+            if level is None:
+                raise ValueError(f"NIST level not found for {variant}")
+            if level in nist_levels:
+                variants_with_levels[level] = variant
                     
         if variants_with_levels:
             matches[input_mechanism] = variants_with_levels
@@ -130,14 +138,14 @@ def mechanisms_groups(input_mechanisms, mechanisms, normalizer, nist_levels, oqs
     return matches
 
 
-def get_ecdsa_mechanisms(input_mechanisms, curves, nist_levels):
+def get_ecdsa_mechanisms(input_mechanisms, classical_mechanisms, nist_levels):
     
     matches = {}
     
     for mechanism in input_mechanisms:
-        if mechanism == "ecdsa":
+        if mechanism in classical_mechanisms:
             variants_with_levels = {}
-            for level, variant in curves.items():
+            for level, variant in classical_mechanisms[mechanism].items():
 
                 if level in nist_levels:
                     variants_with_levels[level] = variant
@@ -148,6 +156,41 @@ def get_ecdsa_mechanisms(input_mechanisms, curves, nist_levels):
     return matches
 
 
+def isolated_cores(jobs):
+    """
+    Selects the cores used to run the workers of a parallel evaluation.
+
+    Args:
+        jobs (int): Number of workers requested.
+
+    Returns:
+        list of int: Cores available to the current process, at most `jobs` of them.
+
+    Raises:
+        ValueError: If more workers are requested than cores available.
+    """
+    cores = sorted(os.sched_getaffinity(0))
+
+    if jobs > len(cores):
+        raise ValueError(f"Requested {jobs} jobs, but only {len(cores)} cores are available")
+
+    return cores[:jobs]
+
+def pin_worker(cores, next_core):
+    """
+    Process pool initializer that pins each worker to its own core.
+
+    Args:
+        cores (list of int): Cores reserved for the workers.
+        next_core (multiprocessing.Value): Shared counter used to hand out the cores.
+    """
+    with next_core.get_lock():
+        core = cores[next_core.value % len(cores)]
+        next_core.value += 1
+
+    os.sched_setaffinity(0, {core})
+
+
 def positive_int(value: int):
     """
     Validates that the provided value is a positive integer.
@@ -166,6 +209,67 @@ def positive_int(value: int):
         raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
     return ivalue
 
+def warm_up_int(value: str):
+    """
+    Validates the number of warm up executions.
+
+    Parameters:
+        value (str): A non-negative integer, or "auto" to detect steady state.
+
+    Returns:
+        int or str: The validated non-negative integer, or "auto".
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is neither "auto" nor a non-negative integer.
+    """
+    if value == "auto":
+        return value
+    return non_negative_int(value)
+
+def size_bytes(value: str):
+    """
+    Validates a size in bytes, accepting the binary suffixes K, M and G
+    (e.g., "32", "4K", "1M").
+
+    Parameters:
+        value (str): The size to validate.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive size.
+    """
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+    suffix = value[-1:].upper()
+    try:
+        size = int(value[:-1]) * units[suffix] if suffix in units else int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid size")
+
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive size")
+    return size
+
+def positive_float(value: float):
+    """
+    Validates that the provided value is a positive float.
+
+    Parameters:
+        value (float): The value to validate.
+
+    Returns:
+        float: The validated positive float.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive float.
+    """
+    fvalue = float(value)
+    if fvalue <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+    return fvalue
+
 def non_negative_int(value: int):
     """
     Validates that the provided value is a non-negative integer.
@@ -182,4 +286,31 @@ def non_negative_int(value: int):
     ivalue = int(value)
     if ivalue < 0:
         raise argparse.ArgumentTypeError(f"{value} is not a non-negative integer")
-    return ivalue
\ No newline at end of file
+    return ivalue
+
+def cpu_list(value: str):
+    """
+    Validates a list of CPUs in the format of taskset/cpuset, with
+    comma-separated CPUs and ranges (e.g., "2", "0-3", "0,2,4-7").
+
+    Parameters:
+        value (str): The CPU list to validate.
+
+    Returns:
+        set of int: The CPUs of the list.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a valid CPU list.
+    """
+    cpus = set()
+    try:
+        for part in value.split(","):
+            first, _, last = part.partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid CPU list")
+
+    if not cpus or min(cpus) < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid CPU list")
+
+    return cpus